@@ -0,0 +1,32 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+from .connections import run_sync
+
+
+def render(view, request, *args, **kwargs):
+    response = view(request, *args, **kwargs)
+    if callable(getattr(response, 'render', None)):
+        response.render()
+    return response
+
+
+def async_reads(view):
+    @wraps(view)
+    async def async_view(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return await run_sync(render, view, request, *args, **kwargs)
+        return await sync_to_async(view)(request, *args, **kwargs)
+    return async_view
+
+
+class AsyncReadMixin:
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if settings.ASYNC_READ_VIEWS:
+            return async_reads(view)
+        return view
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+SNAPSHOT_FIELDS = ('id', 'username', 'role', 'is_staff', 'is_active')
+USER_INACTIVE = 'Пользователь неактивен.'
+NO_USER_ID = 'Токен не содержит идентификатор пользователя.'
+
+
+def get_cache():
+    return caches[settings.AUTH_USER_CACHE_ALIAS]
+
+
+def make_key(user_id):
+    return f'{settings.AUTH_USER_CACHE_PREFIX}:{user_id}'
+
+
+def forget_user(user_id):
+    get_cache().delete(make_key(user_id))
+
+
+def load_deferred_fields(user):
+    deferred = user.get_deferred_fields()
+    if deferred:
+        user.refresh_from_db(fields=deferred)
+    return user
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(NO_USER_ID)
+        snapshot = get_cache().get(make_key(user_id))
+        if snapshot is None:
+            user = super().get_user(validated_token)
+            get_cache().set(
+                make_key(user_id),
+                {field: getattr(user, field) for field in SNAPSHOT_FIELDS},
+                timeout=settings.AUTH_USER_CACHE_TIMEOUT
+            )
+            return user
+        user_model = get_user_model()
+        field_names = [
+            field.attname for field in user_model._meta.concrete_fields
+            if field.attname in snapshot
+        ]
+        user = user_model.from_db(
+            DEFAULT_DB_ALIAS,
+            field_names,
+            [snapshot[name] for name in field_names]
+        )
+        if not user.is_active:
+            raise AuthenticationFailed(USER_INACTIVE, code='user_inactive')
+        return user
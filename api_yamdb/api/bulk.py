@@ -0,0 +1,93 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.serializers import ValidationError
+
+from reviews.models import Category, Genre, Revision, Title
+from .serializers import TitleBulkItemSerializer, TitleGetSerializer
+
+BULK_NOT_A_LIST = 'Ожидается список произведений.'
+BULK_EMPTY = 'Список произведений пуст.'
+BULK_TOO_MANY = 'За один запрос можно создать не больше {limit} произведений.'
+ATOMIC_VALUES = ('1', 'true', 'yes')
+
+
+def get_slug_ids(model, slugs):
+    return dict(
+        model.objects.filter(slug__in=slugs).values_list('slug', 'id')
+    )
+
+
+def validate_items(data):
+    if not isinstance(data, list):
+        raise ValidationError(BULK_NOT_A_LIST)
+    if not data:
+        raise ValidationError(BULK_EMPTY)
+    if len(data) > settings.TITLE_BULK_MAX_ITEMS:
+        raise ValidationError(
+            BULK_TOO_MANY.format(limit=settings.TITLE_BULK_MAX_ITEMS)
+        )
+    items = [TitleBulkItemSerializer(data=item) for item in data]
+    errors = {
+        index: item.errors for index, item in enumerate(items)
+        if not item.is_valid()
+    }
+    return items, errors
+
+
+def build_titles(items, errors):
+    valid = [
+        (index, item) for index, item in enumerate(items)
+        if index not in errors
+    ]
+    genres = get_slug_ids(Genre, {
+        slug for _, item in valid for slug in item.validated_data['genre']
+    })
+    categories = get_slug_ids(Category, {
+        item.validated_data['category'] for _, item in valid
+    })
+    titles, genre_ids = [], []
+    for index, item in valid:
+        missing = item.get_missing_slugs(genres, categories)
+        if missing:
+            errors[index] = missing
+            continue
+        title, title_genres = item.build(genres, categories)
+        titles.append(title)
+        genre_ids.append(title_genres)
+    return titles, genre_ids
+
+
+class TitleBulkCreateMixin:
+    @action(methods=['POST'], detail=False, url_path='bulk')
+    def bulk(self, request):
+        items, errors = validate_items(request.data)
+        titles, genre_ids = build_titles(items, errors)
+        errors = [
+            {'index': index, 'errors': errors[index]}
+            for index in sorted(errors)
+        ]
+        atomic = request.query_params.get('atomic', '').lower()
+        if errors and atomic in ATOMIC_VALUES:
+            titles = []
+        if titles:
+            Title.objects.bulk_create_with_genres(titles, genre_ids)
+            Revision.objects.touch('titles')
+        positions = {title.pk: position for position, title in enumerate(
+            titles
+        )}
+        created = sorted(
+            Title.objects.for_listing().filter(pk__in=positions),
+            key=lambda title: positions[title.pk]
+        )
+        return Response(
+            {
+                'created': TitleGetSerializer(created, many=True).data,
+                'errors': errors,
+            },
+            status=(
+                status.HTTP_201_CREATED if created
+                else status.HTTP_400_BAD_REQUEST
+            )
+        )
@@ -0,0 +1,110 @@
+import time
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.response import Response
+
+from reviews.models import Category, Genre
+from .replicas import read_database
+
+HIT = 'HIT'
+MISS = 'MISS'
+CACHE_HEADER = 'X-Cache'
+CACHED_LISTS = {
+    Category: 'categories',
+    Genre: 'genres',
+}
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def make_key(namespace, *parts):
+    return ':'.join(
+        (settings.RESPONSE_CACHE_PREFIX, namespace) + tuple(map(str, parts))
+    )
+
+
+def get_version(namespace):
+    cache = get_cache()
+    key = make_key(namespace, 'version')
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    cache = get_cache()
+    key = make_key(namespace, 'version')
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def record(namespace, outcome):
+    cache = get_cache()
+    key = make_key(namespace, outcome.lower())
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def get_stats(namespaces):
+    cache = get_cache()
+    stats = {}
+    for namespace in namespaces:
+        keys = {
+            outcome.lower(): make_key(namespace, outcome.lower())
+            for outcome in (HIT, MISS)
+        }
+        values = cache.get_many(keys.values())
+        stats[namespace] = {
+            name: values.get(key, 0) for name, key in keys.items()
+        }
+    return stats
+
+
+class CachedListMixin:
+    def get_list_cache_key(self, request):
+        query = md5(
+            '&'.join(sorted(
+                f'{name}={value}'
+                for name, values in request.query_params.lists()
+                for value in values
+            )).encode('utf-8')
+        ).hexdigest()
+        return make_key(
+            self.basename,
+            get_version(self.basename),
+            request.get_host(),
+            query
+        )
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key(request)
+        data = get_cache().get(key)
+        if data is not None:
+            record(self.basename, HIT)
+            return Response(data, headers={CACHE_HEADER: HIT})
+        token = read_database.set(None)
+        try:
+            response = super().list(request, *args, **kwargs)
+        finally:
+            read_database.reset(token)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        get_cache().set(
+            key, response.data, timeout=settings.RESPONSE_CACHE_TIMEOUT
+        )
+        record(self.basename, MISS)
+        response[CACHE_HEADER] = MISS
+        return response
@@ -0,0 +1,88 @@
+import zlib
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP = 'gzip'
+BROTLI = 'br'
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class GzipEncoder:
+    name = GZIP
+
+    def __init__(self):
+        self.compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS
+        )
+
+    def compress(self, data, final=False):
+        return self.compressor.compress(data) + self.compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class BrotliEncoder:
+    name = BROTLI
+
+    def __init__(self):
+        self.compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    def compress(self, data, final=False):
+        return self.compressor.process(data) + (
+            self.compressor.finish() if final else self.compressor.flush()
+        )
+
+
+def get_encoders():
+    encoders = {GZIP: GzipEncoder}
+    if brotli is not None:
+        encoders[BROTLI] = BrotliEncoder
+    return encoders
+
+
+def parse_quality(params):
+    for param in params.split(';'):
+        name, _, value = param.strip().partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def parse_accept_encoding(header):
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if coding:
+            accepted[coding] = parse_quality(params)
+    return accepted
+
+
+def choose_encoder(header):
+    accepted = parse_accept_encoding(header)
+    candidates = [
+        (accepted.get(name, accepted.get('*', 0.0)), preference, encoder)
+        for preference, (name, encoder) in enumerate(
+            get_encoders().items()
+        )
+    ]
+    quality, _, encoder = max(candidates, key=lambda item: item[:2])
+    return encoder if quality > 0 else None
+
+
+def compress_sequence(sequence, encoder):
+    for chunk in sequence:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.compress(b'', final=True)
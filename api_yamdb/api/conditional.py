@@ -0,0 +1,76 @@
+from hashlib import md5
+
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+from reviews.models import Revision
+
+
+def latest(*timestamps):
+    timestamps = [stamp for stamp in timestamps if stamp is not None]
+    return max(timestamps) if timestamps else None
+
+
+def nested_last_modified(view, parent, children):
+    if view.action == 'retrieve':
+        return children.filter(
+            pk=view.kwargs.get(view.lookup_field)
+        ).values_list('updated_at', flat=True).first()
+    return latest(
+        parent.updated_at,
+        children.aggregate(last_modified=Max('updated_at'))['last_modified']
+    )
+
+
+class ConditionalGetMixin:
+    revision_resources = ()
+
+    def get_last_modified(self):
+        last_modified = Revision.objects.last_modified(
+            *self.revision_resources
+        )
+        if last_modified is None and self.revision_resources:
+            Revision.objects.touch(*self.revision_resources)
+            last_modified = Revision.objects.last_modified(
+                *self.revision_resources
+            )
+        return last_modified
+
+    def get_etag(self, request, last_modified):
+        return '"{}"'.format(md5('|'.join((
+            request.get_host(),
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT', ''),
+            last_modified.isoformat(),
+        )).encode('utf-8')).hexdigest())
+
+    def conditional(self, handler, request, *args, **kwargs):
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return handler(request, *args, **kwargs)
+        etag = self.get_etag(request, last_modified)
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp())
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+
+class ConditionalListMixin(ConditionalGetMixin):
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+
+class ConditionalRetrieveMixin(ConditionalGetMixin):
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
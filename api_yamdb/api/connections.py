@@ -0,0 +1,103 @@
+from contextlib import ExitStack, contextmanager
+from queue import Empty, LifoQueue
+from threading import BoundedSemaphore
+
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .metrics import query_counter, registry
+
+pool = None
+
+
+def count_connection(sender, connection, **kwargs):
+    registry.inc(
+        'yamdb_db_connections_opened_total', (('database', connection.alias),)
+    )
+
+
+def is_healthy(connection):
+    if connection.connection is None or connection.is_usable():
+        return True
+    registry.inc(
+        'yamdb_db_connection_health_check_failures_total',
+        (('database', connection.alias),)
+    )
+    connection.close()
+    return False
+
+
+def check_connections(**kwargs):
+    for connection in connections.all():
+        if connection.settings_dict.get('CONN_HEALTH_CHECKS'):
+            is_healthy(connection)
+
+
+class ConnectionPool:
+    def __init__(self, size, alias=DEFAULT_DB_ALIAS):
+        self.alias = alias
+        self.idle = LifoQueue()
+        self.slots = BoundedSemaphore(size)
+
+    def acquire(self):
+        self.slots.acquire()
+        try:
+            connection = self.idle.get_nowait()
+        except Empty:
+            connection = connections.create_connection(self.alias)
+            connection.inc_thread_sharing()
+        else:
+            is_healthy(connection)
+        return connection
+
+    def release(self, connection):
+        if connection.in_atomic_block:
+            connection.close()
+        else:
+            if connection.errors_occurred:
+                connection.errors_occurred = False
+                is_healthy(connection)
+            self.idle.put(connection)
+        self.slots.release()
+
+    @contextmanager
+    def connection(self):
+        connection = self.acquire()
+        previous = connections[self.alias]
+        connections[self.alias] = connection
+        try:
+            with ExitStack() as stack:
+                counter = query_counter.get()
+                if counter is not None:
+                    stack.enter_context(connection.execute_wrapper(counter))
+                yield connection
+        finally:
+            connections[self.alias] = previous
+            self.release(connection)
+
+    def call(self, func, *args, **kwargs):
+        with self.connection():
+            return func(*args, **kwargs)
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except Empty:
+                return
+
+
+def install_pool(size, alias=DEFAULT_DB_ALIAS):
+    global pool
+    if pool is not None:
+        pool.close()
+    pool = ConnectionPool(size, alias) if size else None
+    return pool
+
+
+async def run_sync(func, *args, **kwargs):
+    if pool is None:
+        return await sync_to_async(func)(*args, **kwargs)
+    return await sync_to_async(pool.call, thread_sensitive=False)(
+        func, *args, **kwargs
+    )
@@ -0,0 +1,59 @@
+from rest_framework.serializers import ValidationError
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+UNKNOWN_FIELDS = 'Неизвестные поля: {fields}.'
+
+
+def parse_names(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def check_names(param, names, available):
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValidationError(
+            {param: UNKNOWN_FIELDS.format(fields=', '.join(unknown))}
+        )
+    return names
+
+
+def select_fields(request, available):
+    if request is None or request.method != 'GET':
+        return None
+    fields = request.query_params.get(FIELDS_PARAM)
+    omit = request.query_params.get(OMIT_PARAM)
+    if fields is None and omit is None:
+        return None
+    requested = available if fields is None else check_names(
+        FIELDS_PARAM, parse_names(fields), available
+    )
+    omitted = check_names(OMIT_PARAM, parse_names(omit or ''), available)
+    return tuple(
+        name for name in available
+        if name in requested and name not in omitted
+    )
+
+
+def only_selected(queryset, fields, keep=('id',), related=None):
+    joined = {
+        name: column for name, column in (related or {}).items()
+        if name in fields
+    }
+    if joined:
+        queryset = queryset.select_related(*joined)
+    return queryset.only(*dict.fromkeys(
+        keep + fields
+        + tuple(f'{name}__{column}' for name, column in joined.items())
+    ))
+
+
+class SparseFieldsMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = select_fields(
+            self.context.get('request'), tuple(self.fields)
+        )
+        if selected is not None:
+            for name in set(self.fields) - set(selected):
+                self.fields.pop(name)
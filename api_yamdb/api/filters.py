@@ -1,5 +1,7 @@
 from rest_framework import filters
 
+from reviews.search import get_search_backend
+
 
 class GenreCategoryFilter(filters.BaseFilterBackend):
     def filter_queryset(self, request, queryset, view):
@@ -10,3 +12,13 @@ class GenreCategoryFilter(filters.BaseFilterBackend):
         if genre:
             queryset = queryset.filter(genre__slug=genre)
         return queryset
+
+
+class TitleSearchFilter(filters.BaseFilterBackend):
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param)
+        if query is None:
+            return queryset
+        return get_search_backend(queryset.db).search(queryset, query)
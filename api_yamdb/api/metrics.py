@@ -0,0 +1,137 @@
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from threading import Lock
+
+COUNTER = 'counter'
+HISTOGRAM = 'histogram'
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+query_counter = ContextVar('query_counter', default=None)
+
+METRICS = {
+    'yamdb_http_requests_total': (
+        COUNTER, 'Total HTTP requests by route, method and status.'
+    ),
+    'yamdb_http_request_duration_seconds': (
+        HISTOGRAM, 'HTTP request latency by route and method.'
+    ),
+    'yamdb_db_queries_total': (
+        COUNTER, 'Database queries executed by route and method.'
+    ),
+    'yamdb_db_query_duration_seconds_total': (
+        COUNTER, 'Time spent in database queries by route and method.'
+    ),
+    'yamdb_db_connections_opened_total': (
+        COUNTER, 'Database connections opened by alias.'
+    ),
+    'yamdb_db_connection_health_check_failures_total': (
+        COUNTER, 'Reused database connections that failed a health check.'
+    ),
+    'yamdb_response_cache_requests_total': (
+        COUNTER, 'List response cache lookups by endpoint and outcome.'
+    ),
+}
+
+
+def escape(value):
+    return (
+        str(value).replace('\\', '\\\\').replace('"', '\\"')
+        .replace('\n', '\\n')
+    )
+
+
+def format_labels(labels, extra=()):
+    pairs = tuple(labels) + tuple(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(
+        f'{name}="{escape(value)}"' for name, value in pairs
+    ) + '}'
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = Lock()
+        self.counters = defaultdict(int)
+        self.histograms = {}
+
+    def inc(self, metric, labels, value=1):
+        with self.lock:
+            self.counters[metric, tuple(labels)] += value
+
+    def observe(self, metric, labels, value):
+        key = metric, tuple(labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [
+                    [0] * (len(self.buckets) + 1), 0.0, 0
+                ]
+            histogram[0][bisect_left(self.buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def clear(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counters), {
+                key: (list(counts), total, count)
+                for key, (counts, total, count) in self.histograms.items()
+            }
+
+    def render(self, extra_counters=()):
+        counters, histograms = self.snapshot()
+        for metric, labels, value in extra_counters:
+            counters[metric, tuple(labels)] = value
+        lines = []
+        for metric, (kind, description) in METRICS.items():
+            source = counters if kind == COUNTER else histograms
+            samples = sorted(
+                (labels, value) for (name, labels), value in source.items()
+                if name == metric
+            )
+            if not samples:
+                continue
+            lines += [f'# HELP {metric} {description}',
+                      f'# TYPE {metric} {kind}']
+            render_samples = (
+                self.render_counter if kind == COUNTER
+                else self.render_histogram
+            )
+            for labels, value in samples:
+                lines += render_samples(metric, labels, value)
+        return '\n'.join(lines) + '\n'
+
+    def render_counter(self, metric, labels, value):
+        return [f'{metric}{format_labels(labels)} {format_value(value)}']
+
+    def render_histogram(self, metric, labels, value):
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket in zip(self.buckets + ('+Inf',), counts):
+            cumulative += bucket
+            lines.append(
+                f'{metric}_bucket{format_labels(labels, (("le", bound),))} '
+                f'{cumulative}'
+            )
+        lines.append(
+            f'{metric}_sum{format_labels(labels)} {format_value(total)}'
+        )
+        lines.append(f'{metric}_count{format_labels(labels)} {count}')
+        return lines
+
+
+registry = Registry()
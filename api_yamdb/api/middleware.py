@@ -0,0 +1,144 @@
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from rest_framework import status
+
+from .compression import choose_encoder, compress_sequence
+from .metrics import query_counter, registry
+
+UNRESOLVED = 'unresolved'
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += perf_counter() - started
+
+
+class MeteredContent:
+    def __init__(self, content, on_close):
+        self.content = iter(content)
+        self.on_close = on_close
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.content)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        on_close, self.on_close = self.on_close, None
+        if on_close is not None:
+            on_close()
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        started = perf_counter()
+        stack = ExitStack()
+        token = query_counter.set(queries)
+        try:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(queries))
+            response = self.get_response(request)
+        except BaseException:
+            stack.close()
+            raise
+        finally:
+            query_counter.reset(token)
+
+        def finish():
+            stack.close()
+            self.record(request, response, queries, perf_counter() - started)
+
+        if response.streaming:
+            response.streaming_content = MeteredContent(
+                response.streaming_content, finish
+            )
+        else:
+            finish()
+        return response
+
+    def record(self, request, response, queries, elapsed):
+        match = request.resolver_match
+        route = match.view_name if match else UNRESOLVED
+        labels = (('route', route), ('method', request.method))
+        registry.inc(
+            'yamdb_http_requests_total',
+            labels + (('status', response.status_code),)
+        )
+        registry.observe(
+            'yamdb_http_request_duration_seconds', labels, elapsed
+        )
+        registry.inc('yamdb_db_queries_total', labels, queries.count)
+        registry.inc(
+            'yamdb_db_query_duration_seconds_total', labels, queries.duration
+        )
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_negotiable(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoder_class = choose_encoder(
+            request.META.get('HTTP_ACCEPT_ENCODING', '')
+        )
+        if encoder_class is None:
+            return response
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        if not self.is_compressible(response):
+            return response
+        encoder = encoder_class()
+        if response.streaming:
+            response.streaming_content = compress_sequence(
+                response.streaming_content, encoder
+            )
+            if response.has_header('Content-Length'):
+                del response['Content-Length']
+        else:
+            content = encoder.compress(response.content, final=True)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+        response['Content-Encoding'] = encoder.name
+        return response
+
+    def is_negotiable(self, response):
+        return not (
+            response.status_code == status.HTTP_204_NO_CONTENT
+            or response.has_header('Content-Encoding')
+        )
+
+    def is_compressible(self, response):
+        if response.status_code == status.HTTP_304_NOT_MODIFIED:
+            return False
+        return response.streaming or (
+            len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        )
@@ -0,0 +1,162 @@
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .filters import TitleSearchFilter
+
+INVALID_CURSOR = 'Некорректный курсор.'
+CURSOR_CONFLICT = (
+    'Параметр `cursor` нельзя сочетать с параметрами сортировки: {params}.'
+)
+SCALARS = (str, int, float)
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+
+    def __init__(self, ordering, page_size):
+        self.ordering = tuple(ordering)
+        self.page_size = page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        position, reverse = self.decode_cursor(request)
+        if position is not None:
+            try:
+                position = self.parse_position(queryset.model, position)
+                queryset = queryset.filter(self.after(position, reverse))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(INVALID_CURSOR)
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self.invert(field) for field in ordering)
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if reverse:
+            self.page.reverse()
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = position is not None if not reverse else has_more
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    @staticmethod
+    def invert(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def after(self, position, reverse):
+        condition = Q()
+        for idx, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            step = Q(**{
+                f'{name}__{"lt" if descending else "gt"}': position[idx]
+            })
+            for prev_field, value in zip(self.ordering[:idx], position):
+                step &= Q(**{prev_field.lstrip('-'): value})
+            condition |= step
+        return condition
+
+    def parse_position(self, model, position):
+        values = []
+        for field_name, value in zip(self.ordering, position):
+            if not isinstance(value, SCALARS) or isinstance(value, bool):
+                raise ValueError(value)
+            try:
+                field = model._meta.get_field(field_name.lstrip('-'))
+            except FieldDoesNotExist:
+                values.append(value)
+                continue
+            values.append(field.to_python(value))
+        return values
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            reverse, position = json.loads(
+                b64decode(encoded.encode('ascii')).decode('utf-8')
+            )
+        except (BinasciiError, UnicodeError, TypeError, ValueError):
+            raise NotFound(INVALID_CURSOR)
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.ordering)
+        ):
+            raise NotFound(INVALID_CURSOR)
+        return position, bool(reverse)
+
+    def encode_cursor(self, obj, reverse):
+        position = [
+            getattr(obj, field.lstrip('-')) for field in self.ordering
+        ]
+        encoded = b64encode(json.dumps(
+            [int(reverse), position], cls=DjangoJSONEncoder
+        ).encode('utf-8')).decode('ascii')
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        ordering = getattr(view, 'keyset_ordering', None)
+        if (
+            ordering
+            and KeysetPagination.cursor_query_param in request.query_params
+        ):
+            conflicts = [
+                param for param in self.get_reordering_params(view)
+                if param in request.query_params
+            ]
+            if conflicts:
+                raise ParseError(
+                    CURSOR_CONFLICT.format(params=', '.join(conflicts))
+                )
+            self.keyset = KeysetPagination(ordering, self.page_size)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    @staticmethod
+    def get_reordering_params(view):
+        params = []
+        for backend in getattr(view, 'filter_backends', ()):
+            if issubclass(backend, OrderingFilter):
+                params.append(backend.ordering_param)
+            elif issubclass(backend, TitleSearchFilter):
+                params.append(backend.search_param)
+        return params
+
+    def get_paginated_response(self, data):
+        if self.keyset:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -21,6 +21,6 @@ class IsAuthorOrAdminOrModerator(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         return (request.method in permissions.SAFE_METHODS
-                or obj.author == request.user
+                or obj.author_id == request.user.pk
                 or request.user.is_moderator
                 or request.user.is_admin)
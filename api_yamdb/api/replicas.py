@@ -0,0 +1,76 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+read_database = ContextVar('read_database', default=None)
+
+
+def get_cache():
+    return caches[settings.REPLICA_STICKY_CACHE_ALIAS]
+
+
+def make_key(user_id):
+    return f'{settings.REPLICA_STICKY_PREFIX}:{user_id}'
+
+
+def stick_to_primary(user):
+    get_cache().set(
+        make_key(user.pk), True, timeout=settings.REPLICA_STICKY_TIMEOUT
+    )
+
+
+def is_sticky(user):
+    return user.is_authenticated and get_cache().get(make_key(user.pk))
+
+
+def choose_replica(request):
+    if not settings.DATABASE_REPLICAS or is_sticky(request.user):
+        return None
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_database.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaReadMixin:
+    def dispatch(self, request, *args, **kwargs):
+        token = read_database.set(None)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            read_database.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            read_database.set(choose_replica(request))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if (
+            request.method not in SAFE_METHODS
+            and status.is_success(response.status_code)
+            and request.user.is_authenticated
+        ):
+            stick_to_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
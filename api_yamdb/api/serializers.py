@@ -5,6 +5,7 @@ from django.conf import settings
 
 from reviews.models import Category, Comment, Genre, Review, Title, User
 from reviews.validators import username_validator
+from .fieldsets import SparseFieldsMixin, select_fields
 
 
 INCORRECT_YEAR = ('Нельзя добавлять произведение,'
@@ -15,9 +16,12 @@ SCORE_VALIDATE = (f'Оценка не может быть ниже '
                   f'{settings.MAX_SCORE}')
 REPEAT_REVIEW = 'Нельзя создать два ревью на одно произведение'
 STATUS_MYSELF = 'Вы не можете присвоить себе статус'
+SLUG_DOES_NOT_EXIST = serializers.SlugRelatedField.default_error_messages[
+    'does_not_exist'
+]
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field='username',
         read_only=True
@@ -49,7 +53,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         return review
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field='username',
         read_only=True
@@ -65,7 +69,7 @@ class CommentSerializer(serializers.ModelSerializer):
         )
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         fields = (
             'name',
@@ -74,15 +78,16 @@ class CategorySerializer(serializers.ModelSerializer):
         model = Category
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         exclude = (
             'id',
+            'updated_at',
         )
         model = Genre
 
 
-class TitleGetSerializer(serializers.ModelSerializer):
+class TitleGetSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     genre = GenreSerializer(many=True, read_only=True)
     category = CategorySerializer()
     rating = serializers.IntegerField(read_only=True)
@@ -101,6 +106,76 @@ class TitleGetSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+def represent_named_slug(obj):
+    if obj is None:
+        return None
+    return {'name': obj.name, 'slug': obj.slug}
+
+
+class ReadSerializer(serializers.BaseSerializer):
+    field_names = ()
+    date_field = serializers.DateField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = select_fields(self.context.get('request'), self.field_names)
+        self.getters = [
+            (name, getattr(self, f'represent_{name}'))
+            for name in (self.field_names if selected is None else selected)
+        ]
+
+    def to_representation(self, obj):
+        return {name: represent(obj) for name, represent in self.getters}
+
+    def represent_id(self, obj):
+        return obj.id
+
+    def represent_text(self, obj):
+        return obj.text
+
+    def represent_author(self, obj):
+        return obj.author.username
+
+    def represent_pub_date(self, obj):
+        if obj.pub_date is None:
+            return None
+        return self.date_field.to_representation(obj.pub_date)
+
+
+class TitleReadSerializer(ReadSerializer):
+    field_names = TitleGetSerializer.Meta.fields
+
+    def represent_name(self, title):
+        return title.name
+
+    def represent_year(self, title):
+        return title.year
+
+    def represent_rating(self, title):
+        rating = getattr(title, 'rating', None)
+        return None if rating is None else int(rating)
+
+    def represent_description(self, title):
+        return title.description
+
+    def represent_genre(self, title):
+        return [represent_named_slug(genre) for genre in title.genre.all()]
+
+    def represent_category(self, title):
+        return represent_named_slug(title.category)
+
+
+class ReviewReadSerializer(ReadSerializer):
+    field_names = ReviewSerializer.Meta.fields
+
+    def represent_score(self, review):
+        return review.score
+
+
+class CommentReadSerializer(ReadSerializer):
+    field_names = CommentSerializer.Meta.fields
+
+
 class TitleSerializer(serializers.ModelSerializer):
     genre = serializers.SlugRelatedField(
         slug_field='slug',
@@ -123,7 +198,41 @@ class TitleSerializer(serializers.ModelSerializer):
         )
 
     def to_representation(self, title):
-        return TitleGetSerializer(title).data
+        return TitleGetSerializer(
+            Title.objects.for_listing().get(pk=title.pk)
+        ).data
+
+
+class TitleBulkItemSerializer(serializers.ModelSerializer):
+    genre = serializers.ListField(child=serializers.SlugField())
+    category = serializers.SlugField()
+
+    class Meta(TitleSerializer.Meta):
+        pass
+
+    def get_missing_slugs(self, genres, categories):
+        errors = {}
+        missing = [
+            slug for slug in self.validated_data['genre']
+            if slug not in genres
+        ]
+        if missing:
+            errors['genre'] = [
+                SLUG_DOES_NOT_EXIST.format(slug_name='slug', value=slug)
+                for slug in missing
+            ]
+        if self.validated_data['category'] not in categories:
+            errors['category'] = [SLUG_DOES_NOT_EXIST.format(
+                slug_name='slug', value=self.validated_data['category']
+            )]
+        return errors
+
+    def build(self, genres, categories):
+        data = dict(self.validated_data)
+        genre_ids = [genres[slug] for slug in dict.fromkeys(data['genre'])]
+        data.pop('genre')
+        data['category_id'] = categories[data.pop('category')]
+        return Title(**data), genre_ids
 
 
 class SignUpSerializer(serializers.Serializer):
@@ -146,7 +255,7 @@ class GetTokenSerializer(serializers.Serializer):
     )
 
 
-class UsersSerializer(serializers.ModelSerializer):
+class UsersSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = (
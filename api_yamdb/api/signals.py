@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+
+from reviews.models import User
+from .authentication import forget_user
+from .cache import CACHED_LISTS, bump_version
+
+
+def invalidate_list_cache(sender, **kwargs):
+    bump_version(CACHED_LISTS[sender])
+
+
+for model in CACHED_LISTS:
+    post_save.connect(invalidate_list_cache, sender=model)
+    post_delete.connect(invalidate_list_cache, sender=model)
+
+
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    forget_user(instance.pk)
+
+
+post_save.connect(invalidate_user_snapshot, sender=User)
+post_delete.connect(invalidate_user_snapshot, sender=User)
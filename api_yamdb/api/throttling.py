@@ -0,0 +1,101 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 60 * 60 * 24}
+
+
+def parse_rate(rate):
+    if rate is None:
+        return None
+    num, period = rate.split('/')
+    return int(num), DURATIONS[period[0]]
+
+
+class CacheBucketStore:
+    def __init__(self, alias=None):
+        self.cache = caches[alias or settings.THROTTLE_CACHE_ALIAS]
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, bucket, timeout):
+        self.cache.set(key, bucket, timeout=timeout)
+
+
+def get_store():
+    return import_string(settings.THROTTLE_STORE)()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    scope = None
+    timer = time.time
+
+    def __init__(self):
+        self.rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        self.capacity, self.duration = parse_rate(self.rate) or (None, None)
+        self.store = get_store()
+        self.retry_after = None
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def make_key(self, ident):
+        return f'{settings.THROTTLE_CACHE_PREFIX}:{self.scope}:{ident}'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        now = self.timer()
+        refill = self.capacity / self.duration
+        tokens, updated_at = self.store.get(key) or (self.capacity, now)
+        tokens = min(
+            self.capacity, tokens + max(now - updated_at, 0) * refill
+        )
+        if tokens < 1:
+            self.retry_after = (1 - tokens) / refill
+            return False
+        self.store.set(key, (tokens - 1, now), self.duration)
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+class AuthRateThrottle(TokenBucketThrottle):
+    scope = 'auth'
+
+    def get_cache_key(self, request, view):
+        return self.make_key(self.get_ident(request))
+
+
+class AnonReadRateThrottle(TokenBucketThrottle):
+    scope = 'anon_read'
+
+    def get_cache_key(self, request, view):
+        if (
+            request.method not in SAFE_METHODS
+            or request.user.is_authenticated
+        ):
+            return None
+        return self.make_key(self.get_ident(request))
+
+
+class UserWriteRateThrottle(TokenBucketThrottle):
+    scope = 'user_write'
+
+    def get_cache_key(self, request, view):
+        if (
+            request.method in SAFE_METHODS
+            or not request.user.is_authenticated
+        ):
+            return None
+        return self.make_key(request.user.pk)
@@ -2,9 +2,12 @@ from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
 from .views import (
+    cache_stats,
     CategoryViewSet,
     CommentViewSet,
+    export_dataset,
     GenreViewSet,
+    metrics,
     ReviewViewSet,
     signup,
     TitleViewSet,
@@ -52,5 +55,12 @@ auth_urls = ([
 
 urlpatterns = [
     path('v1/auth/', include(auth_urls)),
+    path('v1/cache-stats/', cache_stats, name='cache-stats'),
+    path('v1/metrics/', metrics, name='metrics'),
+    path(
+        'v1/export/<slug:dataset>.<slug:export_format>',
+        export_dataset,
+        name='export'
+    ),
     path('v1/', include(router_v1.urls)),
 ]
@@ -1,7 +1,8 @@
 import random
 
 from django.conf import settings
-from django.core.mail import send_mail as send
+
+from reviews.outbox import enqueue
 
 
 def get_confirmation_code():
@@ -14,9 +15,9 @@ def get_confirmation_code():
 
 
 def send_email(to_email, code):
-    send(
+    enqueue(
+        email=to_email,
         subject='Код для получения токена',
-        message=f'Ваш код для получения токена: {code}',
+        body=f'Ваш код для получения токена: {code}',
         from_email=settings.YAMDB_EMAIL,
-        recipient_list=[to_email]
     )
@@ -1,35 +1,61 @@
 from django.conf import settings
-from django.db.models import Avg
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from rest_framework import filters, status, viewsets, mixins
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import (
+    action,
+    api_view,
+    permission_classes,
+    renderer_classes,
+    throttle_classes
+)
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework_simplejwt.tokens import AccessToken
 
-from reviews.models import Category, Genre, Review, Title, User
-from .filters import GenreCategoryFilter
+from reviews.export import CONTENT_TYPES, DATASETS, export
+from reviews.models import Category, Comment, Genre, Review, Title, User
+from .asynchronous import AsyncReadMixin
+from .authentication import load_deferred_fields
+from .bulk import TitleBulkCreateMixin
+from .cache import CACHED_LISTS, CachedListMixin, get_stats
+from .conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    nested_last_modified
+)
+from .fieldsets import only_selected, select_fields
+from .filters import GenreCategoryFilter, TitleSearchFilter
+from .metrics import registry
+from .pagination import PageNumberOrKeysetPagination
 from .permissions import (
     AdminOnly,
     IsAdminOrReadOnly,
     IsAuthorOrAdminOrModerator
 )
+from .renderers import FastJSONRenderer, passthrough_renderers
+from .replicas import ReplicaReadMixin
 from .serializers import (
     CategorySerializer,
+    CommentReadSerializer,
     CommentSerializer,
     GenreSerializer,
     GetTokenSerializer,
+    ReviewReadSerializer,
     ReviewSerializer,
     SignUpSerializer,
-    TitleGetSerializer,
+    TitleReadSerializer,
     TitleSerializer,
     UsersSerializer,
     UsersForUserSerializer
 )
+from .throttling import AuthRateThrottle
 from .utils import get_confirmation_code, send_email
 
 
@@ -39,9 +65,16 @@ INVALID_CONFIRMATION_CODE = (
 )
 UNIQUE_FAILED = 'Пользователь с таким {field_name} существует.'
 SIGNUP_ERROR = 'Ошибка регистрации: {error}'
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+UNKNOWN_EXPORT = 'Неизвестный набор данных или формат выгрузки.'
+WRITE_ACTIONS = ('update', 'partial_update', 'destroy')
+EXPORT_RENDERERS = (FastJSONRenderer, *passthrough_renderers(CONTENT_TYPES))
 
 
 class CategoryGenre(
+    ReplicaReadMixin,
+    ConditionalListMixin,
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.DestroyModelMixin,
@@ -54,82 +87,175 @@ class CategoryGenre(
     lookup_field = 'slug'
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    AsyncReadMixin,
+    ReplicaReadMixin,
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    viewsets.ModelViewSet
+):
     serializer_class = ReviewSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_ordering = ('pub_date', 'id')
     http_method_names = ('get', 'post', 'patch', 'delete',)
     permission_classes = (IsAuthorOrAdminOrModerator,)
 
-    def get_title(self):
+    @cached_property
+    def title(self):
         return get_object_or_404(
             Title,
             id=self.kwargs.get('title_id')
         )
 
     def get_queryset(self):
-        return Review.objects.filter(
-            title=self.get_title()
+        if self.action in WRITE_ACTIONS:
+            return Review.objects.filter(
+                title_id=self.kwargs.get('title_id')
+            ).select_related('author')
+        fields = select_fields(self.request, ReviewReadSerializer.field_names)
+        if fields is None:
+            return self.title.reviews.select_related('author')
+        return only_selected(
+            Review.objects.filter(title_id=self.title.id), fields,
+            keep=self.keyset_ordering + ('title',),
+            related={'author': 'username'}
         )
 
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return ReviewReadSerializer
+        return ReviewSerializer
+
+    def get_last_modified(self):
+        return nested_last_modified(self, self.title, self.title.reviews)
+
+    @transaction.atomic
     def perform_create(self, serializer):
         serializer.save(
             author=self.request.user,
-            title=self.get_title()
+            title=self.title
+        )
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
+
+    @transaction.atomic
+    def perform_destroy(self, review):
+        review.title_id, review.score = get_object_or_404(
+            Review.objects.select_for_update().values_list(
+                'title_id', 'score'
+            ),
+            pk=review.pk
         )
+        review.delete()
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    AsyncReadMixin,
+    ReplicaReadMixin,
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    viewsets.ModelViewSet
+):
     serializer_class = CommentSerializer
     permission_classes = (IsAuthorOrAdminOrModerator,)
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_ordering = ('pub_date', 'id')
     http_method_names = ('get', 'post', 'patch', 'delete',)
 
-    def get_review(self):
+    @cached_property
+    def review(self):
         return get_object_or_404(
             Review,
-            id=self.kwargs.get('review_id')
+            id=self.kwargs.get('review_id'),
+            title_id=self.kwargs.get('title_id')
         )
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        if self.action in WRITE_ACTIONS:
+            return Comment.objects.filter(
+                review_id=self.kwargs.get('review_id'),
+                review__title_id=self.kwargs.get('title_id')
+            ).select_related('author')
+        fields = select_fields(
+            self.request, CommentReadSerializer.field_names
+        )
+        if fields is None:
+            return self.review.comments.select_related('author')
+        return only_selected(
+            Comment.objects.filter(review_id=self.review.id), fields,
+            keep=self.keyset_ordering + ('review',),
+            related={'author': 'username'}
+        )
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return CommentReadSerializer
+        return CommentSerializer
+
+    def get_last_modified(self):
+        return nested_last_modified(self, self.review, self.review.comments)
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user,
-                        review=self.get_review())
+                        review=self.review)
 
 
 class CategoryViewSet(CategoryGenre):
     queryset = Category.objects.all()
+    revision_resources = ('categories',)
     serializer_class = CategorySerializer
 
 
 class GenreViewSet(CategoryGenre):
     queryset = Genre.objects.all()
+    revision_resources = ('genres',)
     serializer_class = GenreSerializer
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(
-        rating=Avg('reviews__score')
-    ).order_by('name')
+class TitleViewSet(
+    AsyncReadMixin,
+    ReplicaReadMixin,
+    TitleBulkCreateMixin,
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    viewsets.ModelViewSet
+):
+    queryset = Title.objects.for_listing().order_by('name')
     permission_classes = (IsAdminOrReadOnly,)
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrKeysetPagination
+    keyset_ordering = ('name', 'id')
+    revision_resources = ('titles', 'categories', 'genres')
     http_method_names = ('get', 'post', 'patch', 'delete',)
     filter_backends = (
         DjangoFilterBackend,
+        TitleSearchFilter,
         filters.OrderingFilter,
         GenreCategoryFilter,
     )
     filterset_fields = ('name', 'year', 'category__slug', 'genre__slug',)
+    ordering_fields = (
+        'id', 'name', 'year', 'rating', 'description', 'genre', 'category',
+    )
+
+    def get_queryset(self):
+        fields = select_fields(self.request, TitleReadSerializer.field_names)
+        if fields is None:
+            return super().get_queryset()
+        if 'rating' in self.request.query_params.get('ordering', ''):
+            fields += ('rating',)
+        return Title.objects.for_listing(fields).order_by('name')
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
-            return TitleGetSerializer
+            return TitleReadSerializer
         return TitleSerializer
 
 
 @api_view(http_method_names=['POST'])
 @permission_classes(permission_classes=[AllowAny])
+@throttle_classes([AuthRateThrottle])
 def signup(request):
     serializer = SignUpSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -158,6 +284,7 @@ def signup(request):
 
 @api_view(http_method_names=['POST'])
 @permission_classes(permission_classes=[AllowAny])
+@throttle_classes([AuthRateThrottle])
 def token(request):
     serializer = GetTokenSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -179,6 +306,46 @@ def token(request):
     )
 
 
+@api_view(http_method_names=['GET'])
+@permission_classes(permission_classes=[AdminOnly])
+def cache_stats(request):
+    return Response(get_stats(CACHED_LISTS.values()))
+
+
+@api_view(http_method_names=['GET'])
+@permission_classes(permission_classes=[AdminOnly])
+def metrics(request):
+    cache_counters = [
+        (
+            'yamdb_response_cache_requests_total',
+            (('endpoint', endpoint), ('outcome', outcome)),
+            value
+        )
+        for endpoint, outcomes in get_stats(CACHED_LISTS.values()).items()
+        for outcome, value in outcomes.items()
+    ]
+    return HttpResponse(
+        registry.render(cache_counters),
+        content_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
+@api_view(http_method_names=['GET'])
+@permission_classes(permission_classes=[AdminOnly])
+@renderer_classes(EXPORT_RENDERERS)
+def export_dataset(request, dataset, export_format):
+    if dataset not in DATASETS or export_format not in CONTENT_TYPES:
+        raise NotFound(UNKNOWN_EXPORT)
+    response = StreamingHttpResponse(
+        export(dataset, export_format),
+        content_type=CONTENT_TYPES[export_format]
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{dataset}.{export_format}"'
+    )
+    return response
+
+
 class UsersViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UsersSerializer
@@ -196,10 +363,11 @@ class UsersViewSet(viewsets.ModelViewSet):
         permission_classes=(IsAuthenticated,)
     )
     def get_current_user_info(self, request):
+        user = load_deferred_fields(request.user)
         if request.method == 'GET':
-            return Response(UsersForUserSerializer(request.user).data)
+            return Response(UsersForUserSerializer(user).data)
         serializer = UsersForUserSerializer(
-            request.user,
+            user,
             data=request.data,
             partial=True,
             context={'request': request}
@@ -1,7 +1,13 @@
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+os.environ.setdefault('YAMDB_ASYNC_READ_VIEWS', '1')
 
 application = get_asgi_application()
+
+if settings.ASGI_DB_POOL_SIZE:
+    from api.connections import install_pool
+    install_pool(settings.ASGI_DB_POOL_SIZE)
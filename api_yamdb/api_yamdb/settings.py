@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -25,6 +26,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.MetricsMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -60,9 +63,55 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+ASGI_DB_POOL_SIZE = 0
+ASYNC_READ_VIEWS = os.getenv('YAMDB_ASYNC_READ_VIEWS', '0') == '1'
+
+DATABASE_ROUTERS = ['api.replicas.ReplicaRouter']
+DATABASE_REPLICAS = ()
+REPLICA_STICKY_CACHE_ALIAS = 'default'
+REPLICA_STICKY_PREFIX = 'replica-sticky'
+REPLICA_STICKY_TIMEOUT = 5
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,
+    'temp_store': 'MEMORY',
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_PREFIX = 'response'
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+
+TITLE_SEARCH_BACKEND = None
+
+TITLE_BULK_MAX_ITEMS = 1000
+
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 4
+
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_PREFIX = 'jwt-user'
+AUTH_USER_CACHE_TIMEOUT = 60
+
+THROTTLE_STORE = 'api.throttling.CacheBucketStore'
+THROTTLE_CACHE_ALIAS = 'default'
+THROTTLE_CACHE_PREFIX = 'throttle'
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -100,13 +149,38 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
+EMAIL_OUTBOX_DELIVERY = 'thread'
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 60
+EMAIL_OUTBOX_LEASE = 5 * 60
+EMAIL_OUTBOX_POLL_INTERVAL = 30
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedUserJWTAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'api.throttling.AnonReadRateThrottle',
+        'api.throttling.UserWriteRateThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'auth': '10/min',
+        'anon_read': '120/min',
+        'user_write': '60/min',
+    },
     'PAGE_SIZE': 5
 }
 
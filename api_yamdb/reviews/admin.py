@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from .models import Category, Comment, Genre, Review, Title, User
+from .models import (
+    Category, Comment, Genre, OutboundEmail, Review, Title, User
+)
 
 
 @admin.register(User)
@@ -35,6 +37,7 @@ class TitleAdmin(admin.ModelAdmin):
     list_display = ('name', 'year', 'description', 'category')
     search_fields = ('name',)
     list_filter = ('year', 'genre')
+    readonly_fields = ('rating_sum', 'rating_count')
 
 
 @admin.register(Review)
@@ -49,3 +52,13 @@ class CommentsAdmin(admin.ModelAdmin):
     list_display = ('review', 'text', 'author', 'pub_date')
     search_fields = ('review', 'author')
     list_filter = ('pub_date',)
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        'email', 'subject', 'created_at', 'attempts', 'sent_at'
+    )
+    search_fields = ('email',)
+    list_filter = ('sent_at', 'attempts')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reviews'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .search import install_search_backend
+        from .sqlite import apply_pragmas
+        post_migrate.connect(install_search_backend, sender=self)
+        connection_created.connect(apply_pragmas)
@@ -0,0 +1,95 @@
+import csv
+from collections import defaultdict
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS
+
+from .models import Category, Comment, Genre, Review, Title, User
+
+CHUNK_SIZE = 2000
+CSV = 'csv'
+NDJSON = 'ndjson'
+CONTENT_TYPES = {
+    CSV: 'text/csv; charset=utf-8',
+    NDJSON: 'application/x-ndjson; charset=utf-8',
+}
+
+DATASETS = {
+    'users': (User, (
+        'id', 'username', 'email', 'role', 'bio', 'first_name', 'last_name'
+    )),
+    'genre': (Genre, ('id', 'name', 'slug')),
+    'category': (Category, ('id', 'name', 'slug')),
+    'titles': (Title, (
+        'id', 'name', 'year', 'category', 'description', 'rating'
+    )),
+    'genre_title': (Title.genre.through, ('id', 'title_id', 'genre_id')),
+    'review': (Review, (
+        'id', 'title_id', 'text', 'author', 'score', 'pub_date'
+    )),
+    'comments': (Comment, ('id', 'review_id', 'text', 'author', 'pub_date')),
+}
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_rows(model, columns, chunk_size, using):
+    queryset = model.objects.using(using)
+    if model is Title:
+        queryset = queryset.with_rating()
+    return queryset.order_by('id').values(*columns).iterator(
+        chunk_size=chunk_size
+    )
+
+
+def add_genres(chunk, using):
+    genres = defaultdict(list)
+    for title_id, genre_id in Title.genre.through.objects.using(
+        using
+    ).filter(
+        title_id__in=[row['id'] for row in chunk]
+    ).order_by('id').values_list('title_id', 'genre_id'):
+        genres[title_id].append(genre_id)
+    for row in chunk:
+        row['genre'] = genres[row['id']]
+    return chunk
+
+
+def render_csv(chunks, columns):
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for chunk in chunks:
+        yield ''.join(
+            writer.writerow([row[column] for column in columns])
+            for row in chunk
+        )
+
+
+def render_ndjson(chunks, model, using):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for chunk in chunks:
+        if model is Title:
+            chunk = add_genres(chunk, using)
+        yield ''.join(f'{encoder.encode(row)}\n' for row in chunk)
+
+
+def export(dataset, export_format, chunk_size=CHUNK_SIZE,
+           using=DEFAULT_DB_ALIAS):
+    model, columns = DATASETS[dataset]
+    chunks = chunked(get_rows(model, columns, chunk_size, using), chunk_size)
+    if export_format == CSV:
+        return render_csv(chunks, columns)
+    return render_ndjson(chunks, model, using)
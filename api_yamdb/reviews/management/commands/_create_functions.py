@@ -1,46 +1,102 @@
-import os
-import sqlite3
+from contextlib import contextmanager
 
-from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
-from reviews.models import User, Category
+from reviews.models import Category, Comment, Genre, Review, Title, User
 
 
-def create_title_genre(datas, model=None):
-    url = os.path.join(settings.BASE_DIR, 'db.sqlite3')
-    con = sqlite3.connect(url)
-    cur = con.cursor()
-    data_list = [
-        tuple(data.values())
-        for data in datas
-    ]
-    cur.executemany(
-        'INSERT INTO reviews_title_genre VALUES(?, ?, ?);', data_list
+def to_id(value, known_ids):
+    if not value:
+        return None
+    pk = int(value)
+    return pk if pk in known_ids else None
+
+
+def to_date(value):
+    if not value:
+        return timezone.localdate()
+    moment = parse_datetime(value)
+    return moment.date() if moment else parse_date(value)
+
+
+@contextmanager
+def preserved_pub_date(model):
+    field = model._meta.get_field('pub_date')
+    auto_now_add = field.auto_now_add
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = auto_now_add
+
+
+def create_user(data, known_ids):
+    user = User(
+        id=int(data['id']),
+        username=data['username'],
+        email=data['email'],
+        role=data.get('role') or User._meta.get_field('role').default,
+        bio=data.get('bio') or None,
+        first_name=data.get('first_name', ''),
+        last_name=data.get('last_name', ''),
     )
-    con.commit()
-    con.close()
+    user.set_unusable_password()
+    return user
+
+
+def create_category(data, known_ids):
+    return Category(id=int(data['id']), name=data['name'], slug=data['slug'])
 
 
-def universal_bulk_create(datas, model):
-    model.objects.bulk_create(
-        model(**data)
-        for data in datas
+def create_genre(data, known_ids):
+    return Genre(id=int(data['id']), name=data['name'], slug=data['slug'])
+
+
+def create_title(data, known_ids):
+    return Title(
+        id=int(data['id']),
+        name=data['name'],
+        year=int(data['year']),
+        description=data.get('description') or None,
+        category_id=to_id(data.get('category'), known_ids[Category]),
     )
 
 
-def create_titles(datas, model):
-    for data in datas:
-        data = dict(data)
-        cat_id = data.pop('category')
-        category = Category.objects.get(id=cat_id)
-        data['category'] = category
-        model.objects.create(**data)
+def create_title_genre(data, known_ids):
+    title_id = to_id(data['title_id'], known_ids[Title])
+    genre_id = to_id(data['genre_id'], known_ids[Genre])
+    if title_id is None or genre_id is None:
+        return None
+    return Title.genre.through(
+        id=int(data['id']), title_id=title_id, genre_id=genre_id
+    )
 
 
-def create_reviews_comments(datas, model):
-    for data in datas:
-        data = dict(data)
-        author_id = data.pop('author')
-        author = User.objects.get(id=author_id)
-        data['author'] = author
-        model.objects.create(**data)
+def create_review(data, known_ids):
+    title_id = to_id(data['title_id'], known_ids[Title])
+    author_id = to_id(data['author'], known_ids[User])
+    if title_id is None or author_id is None:
+        return None
+    return Review(
+        id=int(data['id']),
+        title_id=title_id,
+        author_id=author_id,
+        text=data['text'],
+        score=int(data['score']),
+        pub_date=to_date(data.get('pub_date')),
+    )
+
+
+def create_comment(data, known_ids):
+    review_id = to_id(data['review_id'], known_ids[Review])
+    author_id = to_id(data['author'], known_ids[User])
+    if review_id is None or author_id is None:
+        return None
+    return Comment(
+        id=int(data['id']),
+        review_id=review_id,
+        author_id=author_id,
+        text=data['text'],
+        pub_date=to_date(data.get('pub_date')),
+    )
@@ -0,0 +1,56 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from reviews.export import CHUNK_SIZE, CONTENT_TYPES, CSV, DATASETS, export
+
+
+class Command(BaseCommand):
+    help = 'This command exports the database in the importfrom_csv layout'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            required=True,
+            help='Directory for exported files'
+        )
+        parser.add_argument(
+            '--format',
+            choices=tuple(CONTENT_TYPES),
+            default=CSV,
+            help='Output format'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Rows fetched from the database per batch'
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Database alias to export'
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size должен быть больше нуля')
+        os.makedirs(options['path'], exist_ok=True)
+        for dataset in DATASETS:
+            path = os.path.join(
+                options['path'], f'{dataset}.{options["format"]}'
+            )
+            self.stdout.write(f'Выгрузка {dataset}...', ending=' ')
+            started = time.perf_counter()
+            with open(path, 'w', encoding='utf8', newline='') as output:
+                output.writelines(export(
+                    dataset,
+                    options['format'],
+                    options['chunk_size'],
+                    options['database']
+                ))
+            self.stdout.write(
+                f'(ok) {path} за {time.perf_counter() - started:.2f} с'
+            )
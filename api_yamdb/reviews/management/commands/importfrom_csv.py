@@ -1,47 +1,136 @@
 import csv
 import os
+import time
+from contextlib import nullcontext
+from itertools import islice
 
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 
 from . import _create_functions
-from reviews.models import User, Genre, Category, Title, Review, Comments
+from reviews.models import Category, Comment, Genre, Review, Revision, Title
+from reviews.models import User
+
+CHUNK_SIZE = 5000
 
 csv_names_model_function = (
-    ('users', User, False),
-    ('genre', Genre, False),
-    ('category', Category, False),
-    ('titles', Title, _create_functions.create_titles),
-    ('genre_title', None, _create_functions.create_title_genre),
-    ('review', Review, _create_functions.create_reviews_comments),
-    ('comments', Comments, _create_functions.create_reviews_comments)
+    ('users', User, _create_functions.create_user),
+    ('genre', Genre, _create_functions.create_genre),
+    ('category', Category, _create_functions.create_category),
+    ('titles', Title, _create_functions.create_title),
+    ('genre_title', Title.genre.through, _create_functions.create_title_genre),
+    ('review', Review, _create_functions.create_review),
+    ('comments', Comment, _create_functions.create_comment),
 )
 
 
-def run_populating():
-    for csv_name, model, func in csv_names_model_function:
-        url_to_csv_file = os.path.join(
-            settings.BASE_DIR, f'static/data/{csv_name}.csv'
+class KnownIds(dict):
+    def __init__(self, using):
+        super().__init__()
+        self.using = using
+
+    def __missing__(self, model):
+        return self.reload(model)
+
+    def reload(self, model):
+        self[model] = set(
+            model.objects.using(self.using).values_list(
+                'id', flat=True
+            ).iterator()
         )
-        print(f'Подготовка модели {csv_name}...', end=' ')
-        with open(url_to_csv_file, 'r', encoding="utf8") as csv_file:
-            csv_reader = csv.DictReader(csv_file)
-            if not func:
-                _create_functions.universal_bulk_create(
-                    datas=csv_reader, model=model
+        return self[model]
+
+    def forget(self, model):
+        self.pop(model, None)
+
+
+def read_chunks(csv_file, chunk_size):
+    reader = csv.DictReader(csv_file)
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def populate_model(path, model, create, known_ids, chunk_size):
+    rows = skipped = 0
+    dates = (
+        _create_functions.preserved_pub_date(model)
+        if model in (Review, Comment) else nullcontext()
+    )
+    with open(path, 'r', encoding='utf8') as csv_file, dates:
+        with transaction.atomic(using=known_ids.using):
+            for chunk in read_chunks(csv_file, chunk_size):
+                objects = [
+                    obj for obj in (
+                        create(data, known_ids) for data in chunk
+                    ) if obj is not None
+                ]
+                model.objects.using(known_ids.using).bulk_create(
+                    objects, ignore_conflicts=True
                 )
-            else:
-                func(datas=csv_reader, model=model)
-        print('(ok)')
+                rows += len(chunk)
+                skipped += len(chunk) - len(objects)
+    known_ids.forget(model)
+    return rows, skipped
+
+
+def finish_populating(using):
+    connection = connections[using]
+    models = [model for _, model, _ in csv_names_model_function]
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(sql)
+        Title.objects.using(using).recalculate_rating()
+        Revision.objects.using(using).touch(
+            'titles', 'categories', 'genres'
+        )
 
 
 class Command(BaseCommand):
     help = 'This command populates the database'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=os.path.join(settings.BASE_DIR, 'static', 'data'),
+            help='Directory with csv files'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Rows read and inserted per batch'
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Database alias to populate'
+        )
+
     def handle(self, *args, **options):
-        try:
-            print('START!')
-            run_populating()
-            print('FINISH!')
-        except Exception as error:
-            raise Exception(error)
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size должен быть больше нуля')
+        known_ids = KnownIds(options['database'])
+        self.stdout.write('START!')
+        for csv_name, model, create in csv_names_model_function:
+            path = os.path.join(options['path'], f'{csv_name}.csv')
+            if not os.path.exists(path):
+                raise CommandError(f'Файл {path} не найден')
+            self.stdout.write(f'Подготовка модели {csv_name}...', ending=' ')
+            started = time.perf_counter()
+            rows, skipped = populate_model(
+                path, model, create, known_ids, options['chunk_size']
+            )
+            seconds = time.perf_counter() - started
+            self.stdout.write(
+                f'(ok) {rows} строк за {seconds:.2f} с '
+                f'({rows / max(seconds, 1e-9):.0f} строк/с, '
+                f'пропущено {skipped})'
+            )
+        finish_populating(options['database'])
+        self.stdout.write('FINISH!')
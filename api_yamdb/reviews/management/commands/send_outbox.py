@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from reviews.outbox import deliver_pending, worker
+
+
+class Command(BaseCommand):
+    help = 'This command sends queued emails from the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            help='Number of emails sent over one mail connection',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll the outbox for new emails',
+        )
+
+    def handle(self, *args, **options):
+        if options['loop']:
+            worker.run(options['batch_size'])
+            return
+        sent, failed = deliver_pending(options['batch_size'])
+        self.stdout.write(f'Отправлено писем: {sent}, ошибок: {failed}')
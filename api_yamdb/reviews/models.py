@@ -1,7 +1,12 @@
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import ExpressionWrapper, F, FloatField, OuterRef
+from django.db.models import Count, Max, Subquery, Sum
+from django.db.models.functions import Coalesce, NullIf
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.mail import EmailMessage
+from django.utils import timezone
 
 from .validators import username_validator, validate_year
 
@@ -70,6 +75,117 @@ class User(AbstractUser):
         return self.username
 
 
+class RevisionQuerySet(models.QuerySet):
+    def touch(self, *resources):
+        now = timezone.now()
+        if self.filter(resource__in=resources).update(
+            updated_at=now
+        ) < len(resources):
+            self.bulk_create(
+                (Revision(resource=resource, updated_at=now)
+                 for resource in resources),
+                ignore_conflicts=True
+            )
+
+    def last_modified(self, *resources):
+        return self.filter(resource__in=resources).aggregate(
+            last_modified=Max('updated_at')
+        )['last_modified']
+
+
+class Revision(models.Model):
+    resource = models.CharField(
+        verbose_name='Ресурс',
+        max_length=50,
+        unique=True,
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата изменения',
+    )
+
+    objects = RevisionQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = 'Ревизия ресурса'
+        verbose_name_plural = 'Ревизии ресурсов'
+
+    def __str__(self):
+        return self.resource
+
+
+class OutboundEmailQuerySet(models.QuerySet):
+    def ready(self, now=None):
+        return self.filter(
+            sent_at__isnull=True,
+            attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            next_attempt_at__lte=now or timezone.now(),
+        ).order_by('next_attempt_at', 'id')
+
+
+class OutboundEmail(models.Model):
+    email = models.EmailField(
+        verbose_name='Получатель',
+        max_length=settings.EMAIL_MAX_LENGTH,
+    )
+    from_email = models.EmailField(
+        verbose_name='Отправитель',
+        max_length=settings.EMAIL_MAX_LENGTH,
+    )
+    subject = models.CharField(
+        verbose_name='Тема',
+        max_length=255,
+    )
+    body = models.TextField(
+        verbose_name='Текст письма',
+    )
+    created_at = models.DateTimeField(
+        verbose_name='Дата создания',
+        auto_now_add=True,
+    )
+    next_attempt_at = models.DateTimeField(
+        verbose_name='Следующая попытка',
+        default=timezone.now,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name='Попыток отправки',
+        default=0,
+    )
+    sent_at = models.DateTimeField(
+        verbose_name='Дата отправки',
+        blank=True,
+        null=True,
+    )
+    last_error = models.TextField(
+        verbose_name='Последняя ошибка',
+        blank=True,
+    )
+
+    objects = OutboundEmailQuerySet.as_manager()
+
+    class Meta:
+        ordering = ('created_at',)
+        verbose_name = 'Исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+        indexes = (
+            models.Index(
+                fields=('sent_at', 'next_attempt_at'),
+                name='reviews_outbox_ready_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.email}: {self.subject}'
+
+    def to_message(self, connection=None):
+        return EmailMessage(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=[self.email],
+            connection=connection,
+        )
+
+
 class NamedSlug(models.Model):
     name = models.CharField(
         verbose_name='Название',
@@ -80,6 +196,10 @@ class NamedSlug(models.Model):
         max_length=50,
         unique=True,
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата изменения',
+        auto_now=True,
+    )
 
     class Meta:
         abstract = True
@@ -102,6 +222,10 @@ class AuthoredText(models.Model):
         on_delete=models.CASCADE,
         verbose_name='Автор',
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата изменения',
+        auto_now=True,
+    )
 
     class Meta:
         abstract = True
@@ -120,6 +244,77 @@ class Genre(NamedSlug):
         verbose_name_plural = 'Жанры'
 
 
+TITLE_COLUMNS = ('year', 'description', 'category')
+
+
+class TitleQuerySet(models.QuerySet):
+    def with_rating(self):
+        return self.annotate(rating=ExpressionWrapper(
+            F('rating_sum') * 1.0 / NullIf(F('rating_count'), 0),
+            output_field=FloatField()
+        ))
+
+    def for_listing(self, fields=None):
+        if fields is None:
+            return self.with_rating().select_related(
+                'category'
+            ).prefetch_related('genre')
+        queryset = self.only('id', 'name', *(
+            field for field in fields if field in TITLE_COLUMNS
+        ))
+        if 'rating' in fields:
+            queryset = queryset.with_rating()
+        if 'category' in fields:
+            queryset = queryset.select_related('category')
+        if 'genre' in fields:
+            queryset = queryset.prefetch_related('genre')
+        return queryset
+
+    def change_rating(self, score, count=0):
+        return self.update(
+            rating_sum=F('rating_sum') + score,
+            rating_count=F('rating_count') + count,
+            updated_at=timezone.now()
+        )
+
+    def bulk_create_with_genres(self, titles, genre_ids):
+        connection = connections[self.db]
+        with transaction.atomic(using=self.db):
+            if connection.features.can_return_rows_from_bulk_insert:
+                self.bulk_create(titles)
+            elif connection.vendor != 'sqlite':
+                for title in titles:
+                    title.save(force_insert=True, using=self.db)
+            elif titles:
+                self.bulk_create(titles)
+                created_ids = self.order_by('-pk').values_list(
+                    'pk', flat=True
+                )[:len(titles)]
+                for title, pk in zip(titles, list(created_ids)[::-1]):
+                    title.pk = pk
+            self.model.genre.through.objects.using(self.db).bulk_create(
+                self.model.genre.through(title_id=title.pk, genre_id=genre)
+                for title, genres in zip(titles, genre_ids)
+                for genre in genres
+            )
+        return titles
+
+    def recalculate_rating(self):
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        return self.update(
+            rating_sum=Coalesce(
+                Subquery(reviews.annotate(total=Sum('score')).values('total')),
+                0
+            ),
+            rating_count=Coalesce(
+                Subquery(reviews.annotate(total=Count('pk')).values('total')),
+                0
+            )
+        )
+
+
 class Title(models.Model):
     name = models.CharField(
         verbose_name='Название',
@@ -145,12 +340,41 @@ class Title(models.Model):
         null=True,
         blank=True,
         verbose_name='Категория',
+        db_index=False,
+    )
+    rating_sum = models.PositiveIntegerField(
+        verbose_name='Сумма оценок',
+        default=0,
+    )
+    rating_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок',
+        default=0,
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата изменения',
+        auto_now=True,
+    )
+
+    objects = TitleQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
         default_related_name = 'titles'
+        indexes = (
+            models.Index(
+                fields=('name', 'id'),
+                name='reviews_title_name_idx',
+            ),
+            models.Index(
+                fields=('year', 'name', 'id'),
+                name='reviews_title_year_idx',
+            ),
+            models.Index(
+                fields=('category', 'name', 'id'),
+                name='reviews_title_category_idx',
+            ),
+        )
 
     def __str__(self):
         return self.name[:15]
@@ -160,7 +384,8 @@ class Review(AuthoredText):
     title = models.ForeignKey(
         Title,
         on_delete=models.CASCADE,
-        verbose_name='Произведение'
+        verbose_name='Произведение',
+        db_index=False,
     )
     score = models.IntegerField(
         verbose_name='Оценка',
@@ -176,6 +401,16 @@ class Review(AuthoredText):
             fields=('title', 'author'),
             name='unique_review'
         ),)
+        indexes = (
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='reviews_review_title_idx',
+            ),
+            models.Index(
+                fields=('title', 'updated_at'),
+                name='reviews_review_updated_idx',
+            ),
+        )
 
     def __str__(self):
         return self.title
@@ -186,12 +421,23 @@ class Comment(AuthoredText):
         Review,
         on_delete=models.CASCADE,
         verbose_name='Отзыв',
+        db_index=False,
     )
 
     class Meta(AuthoredText.Meta):
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        indexes = (
+            models.Index(
+                fields=('review', 'pub_date', 'id'),
+                name='reviews_comment_review_idx',
+            ),
+            models.Index(
+                fields=('review', 'updated_at'),
+                name='reviews_comment_updated_idx',
+            ),
+        )
 
     def __str__(self):
         return self.name[:15]
@@ -0,0 +1,153 @@
+import logging
+from datetime import timedelta
+from threading import Event, Lock, Thread
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+THREAD = 'thread'
+EAGER = 'eager'
+COMMAND = 'command'
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(email, subject, body, from_email=None):
+    outbound = OutboundEmail.objects.create(
+        email=email,
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.YAMDB_EMAIL,
+    )
+    transaction.on_commit(notify)
+    return outbound
+
+
+def notify():
+    delivery = settings.EMAIL_OUTBOX_DELIVERY
+    if delivery == EAGER:
+        deliver_pending()
+    elif delivery == THREAD:
+        worker.wake()
+
+
+def get_retry_delay(attempts):
+    return timedelta(
+        seconds=settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    )
+
+
+def claim_batch(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.ready(now)
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        OutboundEmail.objects.filter(
+            pk__in=[outbound.pk for outbound in batch]
+        ).update(
+            next_attempt_at=now + timedelta(
+                seconds=settings.EMAIL_OUTBOX_LEASE
+            )
+        )
+    return batch
+
+
+def send_batch(batch):
+    sent, failed = [], []
+    try:
+        with get_connection() as mail_connection:
+            for outbound in batch:
+                try:
+                    mail_connection.send_messages(
+                        [outbound.to_message(mail_connection)]
+                    )
+                except Exception as error:
+                    failed.append((outbound, error))
+                else:
+                    sent.append(outbound)
+    except Exception as error:
+        done = {outbound.pk for outbound in sent}
+        done.update(outbound.pk for outbound, _ in failed)
+        failed += [
+            (outbound, error) for outbound in batch
+            if outbound.pk not in done
+        ]
+    return sent, failed
+
+
+def record_results(sent, failed):
+    now = timezone.now()
+    OutboundEmail.objects.filter(
+        pk__in=[outbound.pk for outbound in sent]
+    ).update(sent_at=now, last_error='')
+    for outbound, error in failed:
+        attempts = outbound.attempts + 1
+        logger.warning(
+            'Не удалось отправить письмо %s (попытка %s): %s',
+            outbound.pk, attempts, error
+        )
+        OutboundEmail.objects.filter(pk=outbound.pk).update(
+            attempts=attempts,
+            next_attempt_at=now + get_retry_delay(attempts),
+            last_error=str(error),
+        )
+
+
+def deliver_pending(batch_size=None):
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    sent_total = failed_total = 0
+    while True:
+        batch = claim_batch(batch_size)
+        if not batch:
+            return sent_total, failed_total
+        sent, failed = send_batch(batch)
+        record_results(sent, failed)
+        sent_total += len(sent)
+        failed_total += len(failed)
+
+
+class OutboxWorker:
+    def __init__(self):
+        self.lock = Lock()
+        self.wakeup = Event()
+        self.stopping = Event()
+        self.thread = None
+
+    def wake(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.stopping.clear()
+                self.thread = Thread(
+                    target=self.run, name='email-outbox', daemon=True
+                )
+                self.thread.start()
+        self.wakeup.set()
+
+    def stop(self, timeout=None):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        self.stopping.set()
+        self.wakeup.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def run(self, batch_size=None):
+        try:
+            while not self.stopping.is_set():
+                self.wakeup.clear()
+                try:
+                    deliver_pending(batch_size)
+                except Exception:
+                    logger.exception('Ошибка обработки очереди писем')
+                self.wakeup.wait(settings.EMAIL_OUTBOX_POLL_INTERVAL)
+        finally:
+            connection.close()
+
+
+worker = OutboxWorker()
@@ -0,0 +1,148 @@
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+RANK = 'search_rank'
+WORD_PATTERN = r'\w+'
+
+
+def get_words(query):
+    return re.findall(WORD_PATTERN, query)
+
+
+class TitleSearchBackend:
+    def install(self, connection):
+        pass
+
+    def search(self, queryset, query):
+        words = get_words(query)
+        if not words:
+            return queryset.none()
+        condition = Q()
+        for word in words:
+            condition &= (
+                Q(name__icontains=word) | Q(description__icontains=word)
+            )
+        return queryset.filter(condition).order_by('name', 'id')
+
+
+class SQLiteTitleSearchBackend(TitleSearchBackend):
+    table = 'reviews_title_fts'
+    triggers = {
+        'reviews_title_fts_insert': (
+            'AFTER INSERT ON reviews_title BEGIN '
+            'INSERT INTO {table}(rowid, name, description) '
+            'VALUES (new.id, new.name, new.description); END'
+        ),
+        'reviews_title_fts_delete': (
+            'AFTER DELETE ON reviews_title BEGIN '
+            "INSERT INTO {table}({table}, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); END"
+        ),
+        'reviews_title_fts_update': (
+            'AFTER UPDATE OF name, description ON reviews_title BEGIN '
+            "INSERT INTO {table}({table}, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); "
+            'INSERT INTO {table}(rowid, name, description) '
+            'VALUES (new.id, new.name, new.description); END'
+        ),
+    }
+
+    def install(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+                'AND tbl_name = %s',
+                ['reviews_title']
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            if existing.issuperset(self.triggers):
+                return
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} '
+                'USING fts5(name, description, '
+                "content='reviews_title', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            for name, body in self.triggers.items():
+                cursor.execute(
+                    f'CREATE TRIGGER IF NOT EXISTS {name} '
+                    + body.format(table=self.table)
+                )
+            cursor.execute(
+                f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')"
+            )
+
+    def search(self, queryset, query):
+        words = get_words(query)
+        if not words:
+            return queryset.none()
+        match = ' '.join(f'"{word}"*' for word in words)
+        return queryset.extra(
+            select={RANK: f'bm25({self.table}, 10.0, 1.0)'},
+            tables=[self.table],
+            where=[
+                f'{self.table}.rowid = reviews_title.id',
+                f'{self.table} MATCH %s',
+            ],
+            params=[match],
+        ).order_by(RANK, 'name', 'id')
+
+
+class PostgreSQLTitleSearchBackend(TitleSearchBackend):
+    index = 'reviews_title_search_idx'
+    config = 'simple'
+    vector = (
+        "setweight(to_tsvector('{config}', coalesce(reviews_title.name, '')),"
+        " 'A') || setweight(to_tsvector('{config}', "
+        "coalesce(reviews_title.description, '')), 'B')"
+    )
+
+    def get_vector(self):
+        return self.vector.format(config=self.config)
+
+    def install(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {self.index} ON reviews_title '
+                f'USING gin (({self.get_vector()}))'
+            )
+
+    def search(self, queryset, query):
+        words = get_words(query)
+        if not words:
+            return queryset.none()
+        tsquery = ' & '.join(f'{word}:*' for word in words)
+        return queryset.extra(
+            select={RANK: (
+                f'ts_rank({self.get_vector()}, '
+                f"to_tsquery('{self.config}', %s))"
+            )},
+            select_params=[tsquery],
+            where=[
+                f"({self.get_vector()}) @@ to_tsquery('{self.config}', %s)"
+            ],
+            params=[tsquery],
+        ).order_by(f'-{RANK}', 'name', 'id')
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteTitleSearchBackend,
+    'postgresql': PostgreSQLTitleSearchBackend,
+}
+
+
+def get_search_backend(using='default'):
+    backend = getattr(settings, 'TITLE_SEARCH_BACKEND', None)
+    if backend:
+        return import_string(backend)()
+    return VENDOR_BACKENDS.get(
+        connections[using].vendor, TitleSearchBackend
+    )()
+
+
+def install_search_backend(using='default', **kwargs):
+    get_search_backend(using).install(connections[using])
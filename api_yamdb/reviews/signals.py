@@ -0,0 +1,101 @@
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_init, post_save, pre_save
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import (
+    Category, Comment, Genre, Review, Revision, Title, User
+)
+
+TITLES = 'titles'
+REVISION_RESOURCES = {
+    Title: TITLES,
+    Category: 'categories',
+    Genre: 'genres',
+}
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_score(sender, instance, using=None, **kwargs):
+    instance._previous_score = None
+    if instance._state.adding:
+        return
+    reviews = Review.objects.using(using).filter(pk=instance.pk)
+    if transaction.get_connection(using).in_atomic_block:
+        reviews = reviews.select_for_update()
+    instance._previous_score = reviews.values_list(
+        'title_id', 'score'
+    ).first()
+
+
+@receiver(post_save, sender=Review)
+def add_score_to_rating(sender, instance, created, **kwargs):
+    if created:
+        Title.objects.filter(
+            pk=instance.title_id
+        ).change_rating(instance.score, 1)
+        Revision.objects.touch(TITLES)
+        return
+    previous = getattr(instance, '_previous_score', None)
+    if previous is None or previous == (instance.title_id, instance.score):
+        return
+    title_id, score = previous
+    Title.objects.filter(pk=title_id).change_rating(-score, -1)
+    Title.objects.filter(
+        pk=instance.title_id
+    ).change_rating(instance.score, 1)
+    Revision.objects.touch(TITLES)
+
+
+@receiver(post_delete, sender=Review)
+def remove_score_from_rating(sender, instance, **kwargs):
+    Title.objects.filter(
+        pk=instance.title_id
+    ).change_rating(-instance.score, -1)
+    Revision.objects.touch(TITLES)
+
+
+@receiver(post_save, sender=Comment)
+def touch_review_on_comment_save(sender, instance, created, **kwargs):
+    if created:
+        touch_review_on_comment_delete(sender, instance)
+
+
+@receiver(post_delete, sender=Comment)
+def touch_review_on_comment_delete(sender, instance, **kwargs):
+    Review.objects.filter(
+        pk=instance.review_id
+    ).update(updated_at=timezone.now())
+
+
+@receiver(post_init, sender=User)
+def remember_loaded_username(sender, instance, **kwargs):
+    instance._loaded_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=User)
+def touch_authored_texts(sender, instance, created, **kwargs):
+    previous = instance._loaded_username
+    instance._loaded_username = instance.username
+    if created or previous is None or previous == instance.username:
+        return
+    now = timezone.now()
+    for model in (Review, Comment):
+        model.objects.filter(author=instance).update(updated_at=now)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def touch_titles_revision(sender, action, **kwargs):
+    if action.startswith('post_'):
+        Revision.objects.touch(TITLES)
+
+
+def touch_revision(sender, **kwargs):
+    Revision.objects.touch(REVISION_RESOURCES[sender])
+
+
+for model in REVISION_RESOURCES:
+    post_save.connect(touch_revision, sender=model)
+    post_delete.connect(touch_revision, sender=model)
@@ -0,0 +1,79 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from benchmarks.utils import REPEAT, seed
+from reviews.models import User
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DATASET = {
+    'titles': int(os.getenv('YAMDB_BENCH_TITLES', 200)),
+    'users': int(os.getenv('YAMDB_BENCH_USERS', 50)),
+    'reviews_per_title': int(os.getenv('YAMDB_BENCH_REVIEWS_PER_TITLE', 20)),
+    'comments_per_review': int(
+        os.getenv('YAMDB_BENCH_COMMENTS_PER_REVIEW', 2)
+    ),
+    'genres': int(os.getenv('YAMDB_BENCH_GENRES', 20)),
+    'categories': int(os.getenv('YAMDB_BENCH_CATEGORIES', 5)),
+}
+OUTPUT_PATH = os.getenv(
+    'YAMDB_BENCH_OUTPUT', os.path.join(BENCH_DIR, 'results.json')
+)
+BUDGET_PATH = os.getenv(
+    'YAMDB_BENCH_BUDGET', os.path.join(BENCH_DIR, 'budget.json')
+)
+
+
+@pytest.fixture(scope='session')
+def bench_data(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        seed(DATASET)
+    return DATASET
+
+
+@pytest.fixture(autouse=True)
+def relaxed_throttles(settings):
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {
+            scope: '1000000/s'
+            for scope in settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']
+        },
+    }
+
+
+@pytest.fixture
+def anon_client():
+    return APIClient()
+
+
+@pytest.fixture
+def admin_client(bench_data):
+    client = APIClient()
+    token = AccessToken.for_user(User.objects.get(pk=1))
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+@pytest.fixture(scope='session')
+def budget():
+    with open(BUDGET_PATH, encoding='utf8') as budget_file:
+        return json.load(budget_file)
+
+
+@pytest.fixture(scope='session')
+def bench_results():
+    results = {}
+    yield results
+    with open(OUTPUT_PATH, 'w', encoding='utf8') as output:
+        json.dump({
+            'created': datetime.now(timezone.utc).isoformat(),
+            'dataset': DATASET,
+            'repeat': REPEAT,
+            'routes': results,
+        }, output, ensure_ascii=False, indent=2)
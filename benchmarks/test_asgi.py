@@ -0,0 +1,73 @@
+import asyncio
+import importlib
+import os
+import time
+
+import pytest
+from django.test import AsyncClient
+from django.urls import clear_url_caches
+
+from api import urls as api_urls
+from api.connections import install_pool
+from api_yamdb import urls as root_urls
+from benchmarks.test_endpoints import ROUTES
+from benchmarks.utils import percentile
+
+CONCURRENCY = int(os.getenv('YAMDB_BENCH_ASGI_CONCURRENCY', 16))
+REQUESTS = int(os.getenv('YAMDB_BENCH_ASGI_REQUESTS', 64))
+POOL_SIZE = int(os.getenv('YAMDB_BENCH_ASGI_POOL', 4))
+READ_ROUTES = ('titles-list', 'review-list', 'comment-list')
+
+
+def reload_urls():
+    importlib.reload(api_urls)
+    importlib.reload(root_urls)
+    clear_url_caches()
+
+
+async def load(url):
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    timings = []
+
+    async def send():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(url)
+            timings.append((time.perf_counter() - started) * 1000)
+            return response
+
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(send() for _ in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    return responses, {
+        'concurrency': CONCURRENCY,
+        'rps': round(REQUESTS / elapsed, 1),
+        'p50_ms': round(percentile(timings, 0.5), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('route', READ_ROUTES)
+def test_asgi_concurrency(route, bench_data, bench_results, settings):
+    url = ROUTES[route][2]()
+    bodies = {}
+    for mode in ('sync', 'async'):
+        if mode == 'async':
+            settings.ASYNC_READ_VIEWS = True
+            reload_urls()
+            install_pool(POOL_SIZE)
+        try:
+            responses, bench_results[f'asgi:{mode}:{route}'] = asyncio.run(
+                load(url)
+            )
+        finally:
+            install_pool(0)
+            settings.ASYNC_READ_VIEWS = False
+            reload_urls()
+        assert all(response.status_code == 200 for response in responses)
+        bodies[mode] = responses[0].content
+    assert bodies['sync'] == bodies['async'], (
+        f'Асинхронный ответ маршрута `{route}` отличается от синхронного.'
+    )
@@ -0,0 +1,32 @@
+import pytest
+
+from api.compression import choose_encoder
+from benchmarks.test_endpoints import ROUTES
+from benchmarks.utils import read_body
+
+ACCEPT_ENCODINGS = ('gzip', 'br')
+GET_ROUTES = sorted(
+    route for route, (_, method, _) in ROUTES.items() if method == 'get'
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('route', GET_ROUTES)
+def test_route_compression(route, request, bench_data, bench_results):
+    client_fixture, _, target = ROUTES[route]
+    client = request.getfixturevalue(client_fixture)
+    url = target()
+    raw = len(read_body(client.get(url)))
+    result = {'raw_bytes': raw}
+    for accept_encoding in ACCEPT_ENCODINGS:
+        encoder = choose_encoder(accept_encoding)
+        if encoder is None:
+            continue
+        response = client.get(url, HTTP_ACCEPT_ENCODING=accept_encoding)
+        size = len(read_body(response))
+        result[f'{encoder.name}_bytes'] = size
+        result[f'{encoder.name}_saved'] = round(1 - size / raw, 3)
+        assert size <= raw, (
+            f'Сжатый ответ маршрута `{route}` больше исходного.'
+        )
+    bench_results[f'compression:{route}'] = result
@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import time
+from threading import Thread
+
+import pytest
+from django.db import connection, connections
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from reviews.models import User
+
+WRITERS = int(os.getenv('YAMDB_BENCH_WRITERS', 4))
+READERS = int(os.getenv('YAMDB_BENCH_READERS', 4))
+OPERATIONS = int(os.getenv('YAMDB_BENCH_CONCURRENCY_OPS', 25))
+ALIAS = 'concurrency'
+PROFILES = ('default', 'tuned')
+
+
+class ConcurrencyRouter:
+    def db_for_read(self, model, **hints):
+        return ALIAS
+
+    def db_for_write(self, model, **hints):
+        return ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+
+def copy_database(path):
+    connection.ensure_connection()
+    target = sqlite3.connect(path)
+    connection.connection.backup(target)
+    target.close()
+
+
+def writer(number, stats):
+    user = User.objects.using(ALIAS).create(
+        username=f'writer{number}', email=f'writer{number}@yamdb.fake'
+    )
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}'
+    )
+    for title_id in range(1, OPERATIONS + 1):
+        response = client.post(
+            f'/api/v1/titles/{title_id}/reviews/',
+            {'text': f'Отзыв писателя {number}', 'score': 5}
+        )
+        stats['writes' if response.status_code == 201 else 'errors'] += 1
+
+
+def reader(number, stats):
+    client = APIClient()
+    for _ in range(OPERATIONS):
+        response = client.get('/api/v1/titles/')
+        stats['reads' if response.status_code == 200 else 'errors'] += 1
+
+
+def run(worker, number, stats):
+    try:
+        worker(number, stats)
+    except Exception:
+        stats['errors'] += 1
+    finally:
+        connections.close_all()
+
+
+def run_workers():
+    stats = [
+        {'writes': 0, 'reads': 0, 'errors': 0}
+        for _ in range(WRITERS + READERS)
+    ]
+    threads = [
+        Thread(target=run, args=(worker, number, stats[number]))
+        for number, worker in enumerate(
+            [writer] * WRITERS + [reader] * READERS
+        )
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    totals = {
+        name: sum(worker_stats[name] for worker_stats in stats)
+        for name in ('writes', 'reads', 'errors')
+    }
+    return {
+        'writers': WRITERS,
+        'readers': READERS,
+        'seconds': round(elapsed, 3),
+        'writes_per_s': round(totals['writes'] / elapsed, 1),
+        'reads_per_s': round(totals['reads'] / elapsed, 1),
+        'errors': totals['errors'],
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('profile', PROFILES)
+def test_concurrent_reads_and_writes(profile, bench_data, bench_results,
+                                     settings, tmp_path):
+    if connection.vendor != 'sqlite':
+        pytest.skip('Бенчмарк профиля SQLite')
+    path = str(tmp_path / 'db.sqlite3')
+    copy_database(path)
+    connections.databases[ALIAS] = {**connection.settings_dict, 'NAME': path}
+    settings.DATABASE_ROUTERS = [f'{__name__}.ConcurrencyRouter']
+    if profile == 'default':
+        settings.SQLITE_PRAGMAS = {}
+    try:
+        result = run_workers()
+    finally:
+        connections[ALIAS].close()
+        del connections[ALIAS]
+        del connections.databases[ALIAS]
+    bench_results[f'concurrency:{profile}'] = result
+
+    if profile == 'tuned':
+        assert result['errors'] == 0, (
+            f'Конкурентные запросы завершились ошибками: {result["errors"]}'
+        )
@@ -0,0 +1,153 @@
+import pytest
+from django.urls import URLPattern, URLResolver, reverse
+
+from api import urls
+from benchmarks.utils import measure
+from reviews.models import Category, Comment, Genre, User
+
+TITLE_ID = 1
+REVIEW_ID = 1
+BULK_SIZE = 50
+
+
+def route_names(patterns, namespace=''):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from route_names(
+                pattern.url_patterns,
+                f'{namespace}{pattern.namespace}:'
+                if pattern.namespace else namespace
+            )
+        elif isinstance(pattern, URLPattern):
+            yield f'{namespace}{pattern.name}'
+
+
+def get_comment_id():
+    comment = Comment.objects.filter(review_id=REVIEW_ID).first()
+    if comment is None:
+        pytest.skip('В наборе данных нет комментариев')
+    return comment.id
+
+
+def create_category(iteration):
+    slug = f'bench-delete-{iteration}'
+    Category.objects.create(name=slug, slug=slug)
+    return (reverse('categories-detail', args=(slug,)),)
+
+
+def create_genre(iteration):
+    slug = f'bench-delete-{iteration}'
+    Genre.objects.create(name=slug, slug=slug)
+    return (reverse('genres-detail', args=(slug,)),)
+
+
+def bulk_titles_data(iteration):
+    return (reverse('titles-bulk'), [
+        {
+            'name': f'Пакет {iteration} произведение {idx}',
+            'year': 2000,
+            'genre': ['genre-1', 'genre-2'],
+            'category': 'category-1',
+        }
+        for idx in range(BULK_SIZE)
+    ], 'json')
+
+
+def signup_data(iteration):
+    return (reverse('auth:signup'), {
+        'username': f'signup{iteration}',
+        'email': f'signup{iteration}@yamdb.fake',
+    })
+
+
+def token_data(iteration):
+    user = User.objects.create(
+        username=f'token{iteration}',
+        email=f'token{iteration}@yamdb.fake',
+        confirmation_code='1' * 20,
+    )
+    return (reverse('auth:token'), {
+        'username': user.username,
+        'confirmation_code': user.confirmation_code,
+    })
+
+
+ROUTES = {
+    'auth:signup': ('anon_client', 'post', signup_data),
+    'auth:token': ('anon_client', 'post', token_data),
+    'cache-stats': ('admin_client', 'get', lambda: reverse('cache-stats')),
+    'export': (
+        'admin_client', 'get',
+        lambda: reverse('export', args=('titles', 'ndjson'))
+    ),
+    'metrics': ('admin_client', 'get', lambda: reverse('metrics')),
+    'titles-bulk': ('admin_client', 'post', bulk_titles_data),
+    'titles-list': ('anon_client', 'get', lambda: reverse('titles-list')),
+    'titles-detail': (
+        'anon_client', 'get',
+        lambda: reverse('titles-detail', args=(TITLE_ID,))
+    ),
+    'review-list': (
+        'anon_client', 'get',
+        lambda: reverse('review-list', args=(TITLE_ID,))
+    ),
+    'review-detail': (
+        'anon_client', 'get',
+        lambda: reverse('review-detail', args=(TITLE_ID, REVIEW_ID))
+    ),
+    'comment-list': (
+        'anon_client', 'get',
+        lambda: reverse('comment-list', args=(TITLE_ID, REVIEW_ID))
+    ),
+    'comment-detail': (
+        'anon_client', 'get',
+        lambda: reverse(
+            'comment-detail', args=(TITLE_ID, REVIEW_ID, get_comment_id())
+        )
+    ),
+    'users-list': ('admin_client', 'get', lambda: reverse('users-list')),
+    'users-get-current-user-info': (
+        'admin_client', 'get', lambda: reverse('users-get-current-user-info')
+    ),
+    'users-detail': (
+        'admin_client', 'get',
+        lambda: reverse('users-detail', args=('bench2',))
+    ),
+    'categories-list': (
+        'anon_client', 'get', lambda: reverse('categories-list')
+    ),
+    'categories-detail': ('admin_client', 'delete', create_category),
+    'genres-list': ('anon_client', 'get', lambda: reverse('genres-list')),
+    'genres-detail': ('admin_client', 'delete', create_genre),
+}
+
+
+def test_all_routes_covered():
+    missing = set(route_names(urls.urlpatterns)) - set(ROUTES)
+    assert not missing, f'Нет бенчмарка для маршрутов: {sorted(missing)}'
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('route', sorted(ROUTES))
+def test_route_budget(route, request, bench_data, budget, bench_results,
+                      settings):
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    client_fixture, method, target = ROUTES[route]
+    client = request.getfixturevalue(client_fixture)
+    send = getattr(client, method)
+    if method == 'get':
+        url = target()
+        result = measure(lambda: send(url))
+    else:
+        result = measure(send, prepare=target)
+    bench_results[route] = result
+
+    assert all(status < 400 for status in result['status']), (
+        f'Маршрут `{route}` вернул ошибку: {result["status"]}'
+    )
+    limits = budget.get(route, {})
+    for metric, limit in limits.items():
+        assert result[metric] <= limit, (
+            f'Маршрут `{route}` превысил бюджет `{metric}`: '
+            f'{result[metric]} > {limit}'
+        )
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONRenderer, orjson
+from api.serializers import TitleGetSerializer
+from benchmarks.utils import REPEAT, percentile
+from reviews.models import Title
+
+PAGE_SIZE = 100
+RENDERERS = {
+    'json-render:stdlib': JSONRenderer,
+    'json-render:fast': FastJSONRenderer,
+}
+
+
+def time_render(renderer, data, repeat=REPEAT):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        content = renderer.render(data)
+        timings.append((time.perf_counter() - started) * 1000)
+    return content, {
+        'p50_ms': round(percentile(timings, 0.5), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'bytes': len(content),
+    }
+
+
+@pytest.mark.django_db
+def test_render_title_page(bench_data, bench_results):
+    data = TitleGetSerializer(
+        Title.objects.for_listing().order_by('name')[:PAGE_SIZE], many=True
+    ).data
+    contents = {}
+    for name, renderer_class in RENDERERS.items():
+        contents[name], bench_results[name] = time_render(
+            renderer_class(), data
+        )
+    assert contents['json-render:fast'] == contents['json-render:stdlib'], (
+        'Быстрый рендерер должен выдавать те же байты, что и JSONRenderer.'
+    )
+    if orjson is not None:
+        assert (
+            bench_results['json-render:fast']['p50_ms']
+            <= bench_results['json-render:stdlib']['p50_ms']
+        ), 'Быстрый рендерер медленнее стандартного.'
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from api.serializers import (
+    CommentReadSerializer,
+    CommentSerializer,
+    ReviewReadSerializer,
+    ReviewSerializer,
+    TitleGetSerializer,
+    TitleReadSerializer
+)
+from benchmarks.utils import REPEAT, percentile
+from reviews.models import Comment, Review, Title
+
+MIN_SPEEDUP = 3
+PAGE_SIZE = 100
+SERIALIZERS = {
+    'titles': (
+        TitleGetSerializer, TitleReadSerializer,
+        lambda: Title.objects.for_listing().order_by('name')
+    ),
+    'reviews': (
+        ReviewSerializer, ReviewReadSerializer,
+        lambda: Review.objects.select_related('author').order_by('id')
+    ),
+    'comments': (
+        CommentSerializer, CommentReadSerializer,
+        lambda: Comment.objects.select_related('author').order_by('id')
+    ),
+}
+
+
+def time_serializer(serializer_class, instances, repeat=REPEAT):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = serializer_class(instances, many=True).data
+        timings.append((time.perf_counter() - started) * 1e6)
+    return data, {
+        'p50_us_per_object': round(
+            percentile(timings, 0.5) / len(instances), 3
+        ),
+        'p95_us_per_object': round(
+            percentile(timings, 0.95) / len(instances), 3
+        ),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('resource', sorted(SERIALIZERS))
+def test_read_serializer_speedup(resource, bench_data, bench_results):
+    model_serializer, read_serializer, get_queryset = SERIALIZERS[resource]
+    instances = list(get_queryset()[:PAGE_SIZE])
+    expected, model_result = time_serializer(model_serializer, instances)
+    data, read_result = time_serializer(read_serializer, instances)
+    bench_results[f'serialize:{resource}:model'] = model_result
+    bench_results[f'serialize:{resource}:read'] = read_result
+
+    assert [dict(item) for item in expected] == data, (
+        f'Облегчённый сериализатор `{resource}` возвращает другие данные.'
+    )
+    speedup = (
+        model_result['p50_us_per_object'] / read_result['p50_us_per_object']
+    )
+    assert speedup >= MIN_SPEEDUP, (
+        f'Облегчённый сериализатор `{resource}` быстрее всего в '
+        f'{speedup:.1f} раза.'
+    )
@@ -0,0 +1,104 @@
+import math
+import os
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import ADMIN, Category, Comment, Genre, Review, Title, User
+
+REPEAT = int(os.getenv('YAMDB_BENCH_REPEAT', 20))
+BATCH_SIZE = 5000
+
+
+def percentile(values, share):
+    ordered = sorted(values)
+    return ordered[max(math.ceil(share * len(ordered)) - 1, 0)]
+
+
+def seed(dataset):
+    users = [
+        User(id=idx, username=f'bench{idx}', email=f'bench{idx}@yamdb.fake')
+        for idx in range(1, dataset['users'] + 1)
+    ]
+    users[0].role = ADMIN
+    User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+    Category.objects.bulk_create(
+        Category(id=idx, name=f'Категория {idx}', slug=f'category-{idx}')
+        for idx in range(1, dataset['categories'] + 1)
+    )
+    Genre.objects.bulk_create(
+        Genre(id=idx, name=f'Жанр {idx}', slug=f'genre-{idx}')
+        for idx in range(1, dataset['genres'] + 1)
+    )
+    Title.objects.bulk_create((
+        Title(
+            id=idx,
+            name=f'Произведение {idx}',
+            year=1900 + idx % 120,
+            description=f'Описание произведения {idx}',
+            category_id=idx % dataset['categories'] + 1,
+        )
+        for idx in range(1, dataset['titles'] + 1)
+    ), batch_size=BATCH_SIZE)
+    Title.genre.through.objects.bulk_create((
+        Title.genre.through(
+            title_id=idx, genre_id=(idx + shift) % dataset['genres'] + 1
+        )
+        for idx in range(1, dataset['titles'] + 1)
+        for shift in range(min(3, dataset['genres']))
+    ), batch_size=BATCH_SIZE)
+    reviews_per_title = min(dataset['reviews_per_title'], dataset['users'])
+    Review.objects.bulk_create((
+        Review(
+            id=(title_id - 1) * reviews_per_title + idx + 1,
+            title_id=title_id,
+            author_id=idx + 1,
+            text=f'Отзыв {idx} на произведение {title_id}',
+            score=(title_id + idx) % 10 + 1,
+        )
+        for title_id in range(1, dataset['titles'] + 1)
+        for idx in range(reviews_per_title)
+    ), batch_size=BATCH_SIZE)
+    Comment.objects.bulk_create((
+        Comment(
+            review_id=review_id,
+            author_id=(review_id + idx) % dataset['users'] + 1,
+            text=f'Комментарий {idx}',
+        )
+        for review_id in range(
+            1, dataset['titles'] * reviews_per_title + 1
+        )
+        for idx in range(dataset['comments_per_review'])
+    ), batch_size=BATCH_SIZE)
+    Title.objects.recalculate_rating()
+
+
+def read_body(response):
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+def measure(send, prepare=None, repeat=REPEAT):
+    timings = []
+    queries = []
+    sizes = []
+    statuses = set()
+    for iteration in range(repeat):
+        arguments = prepare(iteration) if prepare else ()
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = send(*arguments)
+            body = read_body(response)
+            timings.append((time.perf_counter() - started) * 1000)
+        queries.append(len(context.captured_queries))
+        sizes.append(len(body))
+        statuses.add(response.status_code)
+    return {
+        'status': sorted(statuses),
+        'queries': max(queries),
+        'p50_ms': round(percentile(timings, 0.5), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'bytes': max(sizes),
+    }
@@ -0,0 +1,22 @@
+import importlib
+
+import pytest
+from django.urls import clear_url_caches
+
+from api import urls as api_urls
+from api_yamdb import urls as root_urls
+
+
+def reload_urls():
+    importlib.reload(api_urls)
+    importlib.reload(root_urls)
+    clear_url_caches()
+
+
+@pytest.fixture
+def async_views(settings):
+    settings.ASYNC_READ_VIEWS = True
+    reload_urls()
+    yield
+    settings.ASYNC_READ_VIEWS = False
+    reload_urls()
@@ -0,0 +1,138 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.db.models import QuerySet
+
+from api.views import ReviewViewSet
+from reviews.models import Review, Title
+
+from tests.utils import create_reviews, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_rating(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json().get('rating')
+
+    def test_01_rating_follows_reviews(self, client, admin_client, admin,
+                                       user, user_client):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        title_id = titles[0]['id']
+        assert self.get_rating(client, title_id) == 5, (
+            'Рейтинг произведения должен быть равен средней оценке отзывов.'
+        )
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            ),
+            data={'score': 9}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(client, title_id) == 7, (
+            'Проверьте, что изменение оценки в отзыве обновляет рейтинг '
+            'произведения.'
+        )
+
+        response = admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(client, title_id) == 9, (
+            'Проверьте, что удаление отзыва обновляет рейтинг произведения.'
+        )
+
+        user.delete()
+        assert self.get_rating(client, title_id) is None, (
+            'Если у произведения не осталось отзывов, значением поля '
+            '`rating` должно быть `None`.'
+        )
+
+    def test_02_rebuild_ratings_command(self, client, admin_client,
+                                        user_client):
+        _, titles = create_reviews(admin_client, {})
+        title_id = titles[1]['id']
+        create_single_review(user_client, title_id, 'Неплохо', 6)
+        create_single_review(admin_client, title_id, 'Отлично', 10)
+
+        Title.objects.update(rating_sum=0, rating_count=0)
+        assert self.get_rating(client, title_id) is None
+
+        call_command('rebuild_ratings')
+        assert self.get_rating(client, title_id) == 8, (
+            'Проверьте, что команда `rebuild_ratings` пересчитывает '
+            'рейтинг произведений по отзывам.'
+        )
+
+    def test_03_previous_score_locked(self, client, admin_client, user_client,
+                                      monkeypatch):
+        _, titles = create_reviews(admin_client, {})
+        title_id = titles[0]['id']
+        review = create_single_review(
+            user_client, title_id, 'Неплохо', 6
+        ).json()
+        locked = []
+        select_for_update = QuerySet.select_for_update
+
+        def spy(queryset, *args, **kwargs):
+            locked.append(queryset.model)
+            return select_for_update(queryset, *args, **kwargs)
+
+        monkeypatch.setattr(QuerySet, 'select_for_update', spy)
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert Review in locked, (
+            'Проверьте, что при изменении отзыва прежняя оценка читается '
+            'с блокировкой строки, иначе параллельные изменения искажают '
+            'рейтинг.'
+        )
+        assert self.get_rating(client, title_id) == 10
+
+    def test_04_delete_uses_current_score(self, client, admin_client,
+                                          user_client, monkeypatch):
+        _, titles = create_reviews(admin_client, {})
+        title_id = titles[0]['id']
+        review = create_single_review(
+            user_client, title_id, 'Неплохо', 6
+        ).json()
+        get_object = ReviewViewSet.get_object
+
+        def get_stale_object(view):
+            stale = get_object(view)
+            current = Review.objects.get(pk=stale.pk)
+            current.score = 10
+            current.save()
+            return stale
+
+        monkeypatch.setattr(ReviewViewSet, 'get_object', get_stale_object)
+        response = user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        title = Title.objects.get(pk=title_id)
+        assert (title.rating_sum, title.rating_count) == (0, 0), (
+            'Проверьте, что при удалении отзыва из рейтинга вычитается '
+            'актуальная оценка, а не прочитанная до начала транзакции.'
+        )
@@ -0,0 +1,42 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+
+    TITLES_URL = '/api/v1/titles/'
+    LIST_QUERIES = 4
+
+    def create_titles(self, count):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genres = [
+            Genre.objects.create(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(3)
+        ]
+        for idx in range(count):
+            title = Title.objects.create(
+                name=f'Произведение {idx}', year=2000, category=category
+            )
+            title.genre.set(genres)
+
+    def count_list_queries(self, client):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.TITLES_URL)
+        return len(context.captured_queries), response.json()['results']
+
+    @pytest.mark.parametrize('titles_count', (1, 5, 12))
+    def test_01_titles_list_queries(self, client, titles_count):
+        self.create_titles(titles_count)
+        queries, results = self.count_list_queries(client)
+        assert results and all(
+            title['genre'] and title['category'] for title in results
+        )
+        assert queries == self.LIST_QUERIES, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` выполняет '
+            f'{self.LIST_QUERIES} запроса к БД независимо от количества '
+            f'произведений на странице, сейчас выполняется {queries}.'
+        )
@@ -0,0 +1,112 @@
+from http import HTTPStatus
+
+import json
+from base64 import b64encode
+from urllib.parse import quote
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10KeysetPagination:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def walk(self, client, url):
+        ids = []
+        pages = []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert not any(
+                'COUNT(' in query['sql'].upper()
+                for query in context.captured_queries
+            ), 'В режиме `cursor` пагинация не должна выполнять COUNT.'
+            data = response.json()
+            assert 'count' not in data
+            ids.extend(item['id'] for item in data['results'])
+            pages.append(data)
+            url = data['next']
+        return ids, pages
+
+    def test_01_titles_cursor(self, client):
+        for idx in range(12):
+            Title.objects.create(name=f'Произведение {idx % 3}', year=2000)
+        expected = list(
+            Title.objects.order_by('name', 'id').values_list('id', flat=True)
+        )
+        ids, pages = self.walk(client, f'{self.TITLES_URL}?cursor=')
+        assert ids == expected, (
+            'Проверьте, что при пагинации по курсору возвращаются все '
+            'произведения без пропусков и повторов в порядке `name, id`.'
+        )
+        assert pages[0]['previous'] is None
+
+        previous = client.get(pages[-1]['previous']).json()
+        assert previous['results'] == pages[-2]['results'], (
+            'Проверьте, что ссылка `previous` возвращает предыдущую страницу.'
+        )
+
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == len(expected), (
+            'Без параметра `cursor` должна работать постраничная пагинация.'
+        )
+
+    def test_02_reviews_cursor(self, client, admin, user, moderator):
+        title = Title.objects.create(name='Произведение', year=2000)
+        for author in (admin, user, moderator):
+            Review.objects.create(
+                title=title, author=author, text='Текст', score=5
+            )
+        expected = list(
+            title.reviews.order_by('pub_date', 'id').values_list(
+                'id', flat=True
+            )
+        )
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+        ids, _ = self.walk(client, f'{url}?cursor=')
+        assert ids == expected
+
+    @staticmethod
+    def cursor(value):
+        return quote(b64encode(json.dumps(value).encode()).decode())
+
+    def test_03_invalid_cursor(self, client):
+        response = client.get(f'{self.TITLES_URL}?cursor=broken')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        title = Title.objects.create(name='Произведение', year=2000)
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+        for url, position in (
+            (self.TITLES_URL, [0, [None, 1]]),
+            (self.TITLES_URL, [0, ['x', 'abc']]),
+            (self.TITLES_URL, [0, ['x', [1]]]),
+            (self.TITLES_URL, [0, [{'a': 1}, 1]]),
+            (self.TITLES_URL, [0, ['x', None]]),
+            (reviews_url, [0, ['not-a-date', 1]]),
+            (reviews_url, [1, ['2024-02-30', 1]]),
+        ):
+            response = client.get(f'{url}?cursor={self.cursor(position)}')
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                f'Проверьте, что курсор `{position}` отклоняется с 404.'
+            )
+        response = client.get(
+            f'{reviews_url}?cursor={self.cursor([0, ["2024-01-01", 1]])}'
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    def test_04_cursor_with_reordering(self, client):
+        Title.objects.create(name='Произведение', year=2000)
+        for query in ('ordering=-year', 'q=Произведение'):
+            response = client.get(f'{self.TITLES_URL}?cursor=&{query}')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                'Проверьте, что параметр `cursor` нельзя сочетать с '
+                f'`{query}`: порядок курсора задан сервером.'
+            )
+            response = client.get(f'{self.TITLES_URL}?{query}')
+            assert response.status_code == HTTPStatus.OK
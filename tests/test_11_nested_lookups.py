@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Comment, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11NestedLookups:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def create_reviews(self, authors):
+        title = Title.objects.create(name='Произведение', year=2000)
+        other_title = Title.objects.create(name='Другое', year=2000)
+        reviews = [
+            Review.objects.create(
+                title=title, author=author, text='Текст', score=5
+            )
+            for author in authors
+        ]
+        for author in authors:
+            Comment.objects.create(
+                review=reviews[0], author=author, text='Комментарий'
+            )
+        return title, other_title, reviews
+
+    def test_01_comments_of_foreign_review(self, client, admin):
+        title, other_title, reviews = self.create_reviews([admin])
+        response = client.get(self.COMMENTS_URL_TEMPLATE.format(
+            title_id=other_title.id, review_id=reviews[0].id
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что запрос к комментариям отзыва, который не '
+            'относится к произведению из URL, возвращает ответ со '
+            'статусом 404.'
+        )
+
+    def test_02_nested_lists_queries(self, client, admin, user, moderator,
+                                     user_superuser):
+        title, _, reviews = self.create_reviews(
+            [admin, user, moderator, user_superuser]
+        )
+        for url in (
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.id),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title.id, review_id=reviews[0].id
+            ),
+        ):
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert len(context.captured_queries) == 4, (
+                f'Проверьте, что GET-запрос к `{url}` получает родительский '
+                'объект одним запросом и не запрашивает автора для каждого '
+                'объекта отдельно.'
+            )
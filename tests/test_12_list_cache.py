@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Category
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ListCache:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    CACHE_STATS_URL = '/api/v1/cache-stats/'
+
+    def test_01_categories_cache(self, client, admin_client,
+                                 django_assert_num_queries):
+        Category.objects.create(name='Фильм', slug='films')
+        response = client.get(self.CATEGORIES_URL)
+        assert response['X-Cache'] == 'MISS'
+
+        with django_assert_num_queries(1):
+            response = client.get(self.CATEGORIES_URL)
+        assert response['X-Cache'] == 'HIT'
+        assert response.json()['count'] == 1
+
+        response = admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Книги', 'slug': 'books'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = client.get(self.CATEGORIES_URL)
+        assert response['X-Cache'] == 'MISS', (
+            'Проверьте, что создание категории сбрасывает кеш списка.'
+        )
+        assert response.json()['count'] == 2
+
+        response = client.get(f'{self.CATEGORIES_URL}?search=Книги')
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['count'] == 1
+
+        response = admin_client.delete(f'{self.CATEGORIES_URL}books/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 1
+
+        response = admin_client.get(self.CACHE_STATS_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['categories'] == {'hit': 1, 'miss': 4}
+
+    def test_02_cache_stats_admin_only(self, client, user_client):
+        assert client.get(self.CACHE_STATS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.CACHE_STATS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
@@ -0,0 +1,117 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Comment, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13ConditionalGet:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def check_not_modified(self, client, url):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.has_header('ETag') and response.has_header(
+            'Last-Modified'
+        ), f'Проверьте, что ответ на GET-запрос к `{url}` содержит ETag.'
+        etag = response['ETag']
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304.'
+        )
+        assert response['ETag'] == etag
+        assert not response.content
+        return etag
+
+    def test_01_titles(self, client, admin_client, user):
+        title = Title.objects.create(name='Произведение', year=2000)
+        etag = self.check_not_modified(client, self.TITLES_URL)
+        detail_url = f'{self.TITLES_URL}{title.id}/'
+        detail_etag = self.check_not_modified(client, detail_url)
+
+        Review.objects.create(title=title, author=user, text='Да', score=7)
+        for url, old_etag in ((self.TITLES_URL, etag),
+                              (detail_url, detail_etag)):
+            response = client.get(url, HTTP_IF_NONE_MATCH=old_etag)
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что после нового отзыва ETag произведений '
+                'меняется.'
+            )
+
+        response = admin_client.delete(detail_url)
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = client.get(
+            self.TITLES_URL,
+            HTTP_IF_MODIFIED_SINCE=client.get(self.TITLES_URL)[
+                'Last-Modified'
+            ]
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_02_reviews_and_comments(self, client, user, admin):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=user, text='Да', score=7
+        )
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.id, review_id=review.id
+        )
+        reviews_etag = self.check_not_modified(client, reviews_url)
+        self.check_not_modified(client, f'{reviews_url}{review.id}/')
+        comments_etag = self.check_not_modified(client, comments_url)
+
+        comment = Comment.objects.create(
+            review=review, author=admin, text='Нет'
+        )
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK
+        self.check_not_modified(client, f'{comments_url}{comment.id}/')
+
+        Review.objects.create(title=title, author=admin, text='Нет', score=1)
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=reviews_etag)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_03_categories(self, client, admin_client):
+        url = '/api/v1/categories/'
+        etag = self.check_not_modified(client, url)
+        admin_client.post(url, data={'name': 'Фильм', 'slug': 'films'})
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_04_author_rename(self, client, user, admin_client):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=user, text='Да', score=7
+        )
+        comment = Comment.objects.create(
+            review=review, author=user, text='Нет'
+        )
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.id, review_id=review.id
+        )
+        urls = (
+            reviews_url, f'{reviews_url}{review.id}/',
+            comments_url, f'{comments_url}{comment.id}/',
+        )
+        etags = [self.check_not_modified(client, url) for url in urls]
+
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'username': 'renamed'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что после смены имени автора ETag его отзывов '
+                f'и комментариев меняется: `{url}`.'
+            )
+            assert 'renamed' in response.content.decode()
@@ -0,0 +1,50 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'q': query})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        return [title['name'] for title in data['results']], data['count']
+
+    def test_01_search_rank_and_prefix(self, client):
+        Title.objects.create(
+            name='Крепкий орешек', year=1988, description='Мост взорван'
+        )
+        Title.objects.create(
+            name='Мост через реку Квай', year=1957,
+            description='Рон Свонсон рекомендует.'
+        )
+        Title.objects.create(name='Терминатор', year=1984)
+
+        names, count = self.search(client, 'мост')
+        assert names == ['Мост через реку Квай', 'Крепкий орешек'], (
+            'Проверьте, что поиск `?q=` ищет по названию и описанию '
+            'и выше ранжирует совпадения в названии.'
+        )
+        assert count == 2
+        assert self.search(client, 'КВА')[0] == ['Мост через реку Квай'], (
+            'Проверьте, что поиск `?q=` поддерживает поиск по префиксу.'
+        )
+        assert self.search(client, 'мост рон')[0] == [
+            'Мост через реку Квай'
+        ]
+        assert self.search(client, '"*')[1] == 0
+
+    def test_02_search_index_follows_changes(self, client):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        title.name = 'Терминатор 2'
+        title.description = 'Судный день'
+        title.save()
+        assert self.search(client, 'судный')[0] == ['Терминатор 2']
+        title.delete()
+        assert self.search(client, 'терминатор')[1] == 0
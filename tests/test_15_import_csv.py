@@ -0,0 +1,64 @@
+import csv
+import os
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from reviews.management.commands.importfrom_csv import KnownIds
+from reviews.models import Comment, Review, Title, User
+from tests.conftest import MANAGE_PATH
+
+DATA_PATH = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def count_rows(name):
+    with open(os.path.join(DATA_PATH, f'{name}.csv'), encoding='utf8') as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15ImportCsv:
+
+    def test_01_import(self):
+        out = StringIO()
+        call_command('importfrom_csv', chunk_size=7, stdout=out)
+        assert 'FINISH!' in out.getvalue()
+        assert User.objects.count() == count_rows('users')
+        assert Title.objects.count() == count_rows('titles')
+        assert Review.objects.count() == count_rows('review')
+        assert Comment.objects.count() == count_rows('comments')
+        assert Title.genre.through.objects.count() == count_rows(
+            'genre_title'
+        )
+        title = Title.objects.get(pk=1)
+        assert title.rating_count == title.reviews.count(), (
+            'Проверьте, что после импорта пересчитывается рейтинг.'
+        )
+        assert str(Review.objects.get(pk=1).pub_date) == '2019-09-24', (
+            'Проверьте, что при импорте сохраняется дата публикации.'
+        )
+
+        call_command('importfrom_csv', stdout=StringIO())
+        assert Review.objects.count() == count_rows('review'), (
+            'Повторный импорт не должен создавать дубликаты.'
+        )
+
+    def test_02_loads_only_referenced_ids(self, monkeypatch):
+        loaded = []
+        reload = KnownIds.reload
+
+        def spy(known_ids, model):
+            loaded.append(model)
+            return reload(known_ids, model)
+
+        monkeypatch.setattr(KnownIds, 'reload', spy)
+        call_command('importfrom_csv', stdout=StringIO())
+        assert Comment not in loaded and Title.genre.through not in loaded, (
+            'Проверьте, что импорт не читает идентификаторы моделей, на '
+            'которые не ссылаются следующие файлы.'
+        )
+        assert len(loaded) == len(set(loaded)), (
+            'Проверьте, что идентификаторы каждой модели читаются не '
+            'больше одного раза.'
+        )
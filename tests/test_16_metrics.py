@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.metrics import registry
+from reviews.models import Category
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Metrics:
+
+    METRICS_URL = '/api/v1/metrics/'
+
+    def test_01_metrics_admin_only(self, client, user_client):
+        assert client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+    def test_02_metrics_per_route(self, client, admin_client):
+        client.get('/api/v1/titles/')
+        client.get('/api/v1/categories/')
+        response = admin_client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Type'].startswith('text/plain')
+        text = response.content.decode()
+        for line in (
+            '# TYPE yamdb_http_requests_total counter',
+            'yamdb_http_requests_total{route="titles-list",method="GET",'
+            'status="200"}',
+            'yamdb_http_request_duration_seconds_bucket{route="titles-list",'
+            'method="GET",le="+Inf"}',
+            'yamdb_db_queries_total{route="titles-list",method="GET"}',
+            'yamdb_db_query_duration_seconds_total{route="titles-list",'
+            'method="GET"}',
+            'yamdb_response_cache_requests_total{endpoint="categories",'
+            'outcome="miss"} 1',
+        ):
+            assert line in text, (
+                f'Проверьте, что эндпоинт `{self.METRICS_URL}` отдаёт '
+                f'метрики в формате Prometheus: не найдено `{line}`.'
+            )
+
+    def test_03_streaming_metrics_after_body(self, admin_client):
+        Category.objects.create(name='Фильм', slug='films')
+        metric = 'yamdb_db_queries_total'
+        labels = (('route', 'export'), ('method', 'GET'))
+        before = registry.snapshot()[0].get((metric, labels), 0)
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get('/api/v1/export/category.csv')
+            assert response.status_code == HTTPStatus.OK
+            assert registry.snapshot()[0].get((metric, labels), 0) == before
+            b''.join(response.streaming_content)
+        assert registry.snapshot()[0].get((metric, labels), 0) - before == (
+            len(queries)
+        ), (
+            'Проверьте, что для потоковых ответов метрики учитывают '
+            'запросы к БД, выполненные при отдаче тела ответа.'
+        )
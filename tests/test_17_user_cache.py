@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17UserCache:
+
+    TITLES_URL = '/api/v1/titles/'
+    CATEGORIES_URL = '/api/v1/categories/'
+    ME_URL = '/api/v1/users/me/'
+
+    def test_01_cached_user_needs_no_query(self, user_client,
+                                           django_assert_num_queries):
+        user_client.get(self.TITLES_URL)
+        with django_assert_num_queries(2):
+            response = user_client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+
+        response = user_client.get(self.ME_URL)
+        assert response.json()['email'] == 'testuser@yamdb.fake', (
+            'Проверьте, что `/users/me/` возвращает полные данные '
+            'пользователя из кеша аутентификации.'
+        )
+
+    def test_02_role_change_invalidates_cache(self, admin_client,
+                                              user_client, user):
+        data = {'name': 'Фильм', 'slug': 'films'}
+        response = user_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'admin'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = user_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что изменение роли пользователя сбрасывает '
+            'кеш аутентификации.'
+        )
+
+        response = admin_client.delete(f'/api/v1/users/{user.username}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = user_client.get(self.ME_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
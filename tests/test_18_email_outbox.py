@@ -0,0 +1,106 @@
+import time
+from http import HTTPStatus
+from smtplib import SMTPException
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+
+from reviews.models import OutboundEmail
+from reviews.outbox import deliver_pending, worker
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18EmailOutbox:
+
+    SIGNUP_URL = '/api/v1/auth/signup/'
+
+    def signup(self, client, number):
+        return client.post(self.SIGNUP_URL, data={
+            'username': f'outbox{number}',
+            'email': f'outbox{number}@yamdb.fake',
+        })
+
+    def test_01_signup_only_queues_email(self, client, settings):
+        settings.EMAIL_OUTBOX_DELIVERY = 'command'
+        response = self.signup(client, 1)
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == 0, (
+            'Проверьте, что при регистрации письмо не отправляется '
+            'синхронно, а попадает в очередь.'
+        )
+        outbound = OutboundEmail.objects.get()
+        assert outbound.email == 'outbox1@yamdb.fake'
+        assert outbound.sent_at is None
+
+    def test_02_command_sends_batch_over_one_connection(
+        self, client, settings, monkeypatch
+    ):
+        settings.EMAIL_OUTBOX_DELIVERY = 'command'
+        for number in range(5):
+            self.signup(client, number)
+        opened = []
+        original_open = EmailBackend.open
+
+        def counting_open(backend):
+            opened.append(backend)
+            return original_open(backend)
+
+        monkeypatch.setattr(EmailBackend, 'open', counting_open)
+        call_command('send_outbox', batch_size=10)
+        assert len(mail.outbox) == 5
+        assert len(opened) == 1, (
+            'Проверьте, что пачка писем отправляется через одно '
+            'соединение с почтовым сервером.'
+        )
+        assert not OutboundEmail.objects.filter(sent_at__isnull=True).exists()
+        assert deliver_pending() == (0, 0), (
+            'Проверьте, что отправленные письма не отправляются повторно.'
+        )
+
+    def test_03_failed_email_is_retried_with_backoff(
+        self, client, settings, monkeypatch
+    ):
+        settings.EMAIL_OUTBOX_DELIVERY = 'command'
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 0
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 3
+        self.signup(client, 1)
+
+        def failing_send(backend, messages):
+            raise SMTPException('Сервер недоступен')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(EmailBackend, 'send_messages', failing_send)
+            assert deliver_pending() == (0, 3)
+        outbound = OutboundEmail.objects.get()
+        assert outbound.attempts == 3
+        assert 'Сервер недоступен' in outbound.last_error
+        assert deliver_pending() == (0, 0), (
+            'Проверьте, что после исчерпания попыток письмо больше '
+            'не отправляется.'
+        )
+
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 60
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+        with monkeypatch.context() as patch:
+            patch.setattr(EmailBackend, 'send_messages', failing_send)
+            assert deliver_pending() == (0, 1)
+        assert deliver_pending() == (0, 0), (
+            'Проверьте, что повторная отправка откладывается.'
+        )
+        assert len(mail.outbox) == 0
+
+    def test_04_background_worker_sends_email(self, client, settings):
+        settings.EMAIL_OUTBOX_DELIVERY = 'thread'
+        try:
+            self.signup(client, 1)
+            deadline = time.monotonic() + 5
+            while not mail.outbox and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            worker.stop(timeout=5)
+        assert len(mail.outbox) == 1, (
+            'Проверьте, что фоновый обработчик отправляет письма из очереди.'
+        )
+        assert mail.outbox[0].to == ['outbox1@yamdb.fake']
@@ -0,0 +1,135 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19TitleBulk:
+
+    BULK_URL = '/api/v1/titles/bulk/'
+
+    @pytest.fixture
+    def catalog(self):
+        Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.create(name='Драма', slug='drama')
+        Genre.objects.create(name='Комедия', slug='comedy')
+        return Title.objects.create(
+            name='Существующее', year=2000, category=None
+        )
+
+    @staticmethod
+    def make_items(count):
+        return [
+            {
+                'name': f'Фильм {number}',
+                'year': 1990 + number,
+                'genre': ['drama', 'comedy'],
+                'category': 'films',
+            }
+            for number in range(count)
+        ]
+
+    def post(self, client, data, url=None):
+        return client.post(
+            url or self.BULK_URL,
+            data=json.dumps(data),
+            content_type='application/json'
+        )
+
+    def test_01_bulk_admin_only(self, client, user_client, catalog):
+        assert self.post(client, self.make_items(1)).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert self.post(user_client, self.make_items(1)).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+    def test_02_bulk_creates_titles_with_genres(self, admin_client, catalog):
+        response = self.post(admin_client, self.make_items(3))
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert data['errors'] == []
+        assert [title['name'] for title in data['created']] == [
+            'Фильм 0', 'Фильм 1', 'Фильм 2'
+        ]
+        for title in data['created']:
+            assert title['category']['slug'] == 'films'
+            assert {genre['slug'] for genre in title['genre']} == {
+                'drama', 'comedy'
+            }
+            stored = Title.objects.get(pk=title['id'])
+            assert stored.name == title['name'], (
+                'Проверьте, что созданным произведениям присвоены '
+                'правильные идентификаторы.'
+            )
+            assert set(stored.genre.values_list('slug', flat=True)) == {
+                'drama', 'comedy'
+            }
+        response = admin_client.get('/api/v1/titles/?q=Фильм')
+        assert response.json()['count'] == 3
+
+    def test_03_bulk_query_count_is_constant(self, admin_client, catalog):
+        self.post(admin_client, self.make_items(1))
+        counts = []
+        for size in (2, 20):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post(admin_client, self.make_items(size))
+            assert response.status_code == HTTPStatus.CREATED
+            counts.append(len(queries))
+        assert counts[0] == counts[1], (
+            'Проверьте, что число запросов к БД не зависит от количества '
+            'произведений в запросе.'
+        )
+
+    def test_04_bulk_reports_item_errors(self, admin_client, catalog):
+        items = self.make_items(3)
+        items[1]['genre'] = ['drama', 'unknown']
+        items[2]['year'] = 3000
+        response = self.post(admin_client, items)
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert [title['name'] for title in data['created']] == ['Фильм 0']
+        assert [error['index'] for error in data['errors']] == [1, 2]
+        assert 'genre' in data['errors'][0]['errors']
+        assert 'year' in data['errors'][1]['errors']
+        assert Title.objects.count() == 2
+
+    def test_05_bulk_atomic(self, admin_client, catalog):
+        items = self.make_items(2)
+        items[1]['category'] = 'unknown'
+        response = self.post(
+            admin_client, items, url=f'{self.BULK_URL}?atomic=true'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json()['created'] == []
+        assert Title.objects.count() == 1, (
+            'Проверьте, что с параметром `atomic` при ошибке не создаётся '
+            'ни одного произведения.'
+        )
+
+    def test_06_bulk_invalid_payload(self, admin_client, catalog):
+        for data in ({'name': 'Фильм'}, []):
+            response = self.post(admin_client, data)
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_07_bulk_without_returned_ids(self, admin_client, catalog,
+                                          monkeypatch):
+        monkeypatch.setattr(connection, 'vendor', 'other')
+        items = self.make_items(3)
+        for item, genres in zip(items, (['drama'], ['comedy'], [])):
+            item['genre'] = genres
+        response = self.post(admin_client, items)
+        assert response.status_code == HTTPStatus.CREATED
+        for item in items:
+            stored = Title.objects.get(name=item['name'])
+            assert set(stored.genre.values_list('slug', flat=True)) == set(
+                item['genre']
+            ), (
+                'Проверьте, что на базах без возврата идентификаторов '
+                'жанры привязываются к своим произведениям.'
+            )
@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Category, Comment, Genre, Review, Title, User
+from tests.conftest import MANAGE_PATH
+
+DATA_PATH = os.path.join(MANAGE_PATH, 'static', 'data')
+EXPORT_URL = '/api/v1/export/{dataset}.{export_format}'
+DATASETS = (
+    'users', 'genre', 'category', 'titles', 'genre_title', 'review',
+    'comments'
+)
+SKIPPED_FIELDS = ('updated_at', 'password', 'date_joined')
+MODELS = (User, Genre, Category, Title, Title.genre.through, Review, Comment)
+
+
+def read_content(response):
+    return b''.join(response.streaming_content).decode()
+
+
+def snapshot():
+    return {
+        model._meta.label: list(
+            model.objects.order_by('id').values_list(
+                *(field.attname for field in model._meta.concrete_fields
+                  if field.attname not in SKIPPED_FIELDS)
+            )
+        )
+        for model in MODELS
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20Export:
+
+    @pytest.fixture
+    def catalog(self):
+        call_command('importfrom_csv', stdout=StringIO())
+
+    def test_01_export_admin_only(self, client, user_client, catalog):
+        url = EXPORT_URL.format(dataset='titles', export_format='csv')
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN
+
+    def test_02_export_unknown(self, admin_client):
+        for dataset, export_format in (('secrets', 'csv'), ('titles', 'xml')):
+            response = admin_client.get(EXPORT_URL.format(
+                dataset=dataset, export_format=export_format
+            ))
+            assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_export_ndjson_titles(self, admin_client, catalog):
+        response = admin_client.get(
+            EXPORT_URL.format(dataset='titles', export_format='ndjson')
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, (
+            'Проверьте, что выгрузка отдаётся потоком '
+            '(`StreamingHttpResponse`).'
+        )
+        assert response['Content-Type'].startswith('application/x-ndjson')
+        rows = [json.loads(line) for line in read_content(response).split(
+            '\n'
+        ) if line]
+        assert len(rows) == Title.objects.count()
+        title = Title.objects.with_rating().get(pk=rows[0]['id'])
+        assert rows[0]['name'] == title.name
+        assert rows[0]['category'] == title.category_id
+        assert rows[0]['rating'] == title.rating
+        assert rows[0]['genre'] == list(
+            Title.genre.through.objects.filter(title=title).order_by(
+                'id'
+            ).values_list('genre_id', flat=True)
+        )
+
+    def test_04_export_csv_matches_import_layout(self, admin_client,
+                                                  catalog):
+        for dataset in DATASETS:
+            response = admin_client.get(
+                EXPORT_URL.format(dataset=dataset, export_format='csv')
+            )
+            assert response.status_code == HTTPStatus.OK
+            header = next(csv.reader(StringIO(read_content(response))))
+            path = os.path.join(DATA_PATH, f'{dataset}.csv')
+            with open(path, encoding='utf8') as data_file:
+                expected = next(csv.reader(data_file))
+            assert set(expected) <= set(header), (
+                f'Проверьте, что выгрузка `{dataset}` содержит все колонки '
+                f'файла `{dataset}.csv`.'
+            )
+
+    def test_05_export_import_round_trip(self, tmp_path, catalog):
+        before = snapshot()
+        out = StringIO()
+        call_command(
+            'export_catalog', path=str(tmp_path), chunk_size=7, stdout=out
+        )
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            f'{dataset}.csv' for dataset in DATASETS
+        )
+        for model in reversed(MODELS):
+            model.objects.all().delete()
+        call_command('importfrom_csv', path=str(tmp_path), stdout=StringIO())
+        assert snapshot() == before, (
+            'Проверьте, что выгрузка загружается командой `importfrom_csv` '
+            'без потерь.'
+        )
+
+    def test_06_export_accept_headers(self, admin_client, catalog):
+        for export_format, accept in (
+            ('csv', 'text/csv'),
+            ('ndjson', 'application/x-ndjson'),
+            ('csv', '*/*'),
+        ):
+            url = EXPORT_URL.format(
+                dataset='titles', export_format=export_format
+            )
+            response = admin_client.get(url, HTTP_ACCEPT=accept)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что выгрузка `{export_format}` отдаётся при '
+                f'заголовке `Accept: {accept}`.'
+            )
+            assert read_content(response)
+        response = admin_client.get(
+            EXPORT_URL.format(dataset='secrets', export_format='csv'),
+            HTTP_ACCEPT='text/csv'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
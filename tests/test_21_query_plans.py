@@ -0,0 +1,101 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Comment, Genre, Review, Title
+
+FULL_SCAN = re.compile(
+    r'\bSCAN (TABLE )?(reviews_review|reviews_comment)\b(?! USING)'
+)
+TEMP_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+
+def explain(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite', reason='EXPLAIN QUERY PLAN есть в SQLite'
+)
+@pytest.mark.django_db(transaction=True)
+class Test21QueryPlans:
+
+    @pytest.fixture
+    def catalog(self, user, moderator):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title = Title.objects.create(name='Фильм', year=2000,
+                                     category=category)
+        title.genre.set([genre])
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=5
+        )
+        Review.objects.create(
+            title=title, author=moderator, text='Отзыв', score=7
+        )
+        comment = Comment.objects.create(
+            review=review, author=user, text='Комментарий'
+        )
+        return title, review, comment
+
+    def urls(self, title, review, comment):
+        reviews = f'/api/v1/titles/{title.id}/reviews/'
+        comments = f'{reviews}{review.id}/comments/'
+        return (
+            '/api/v1/titles/',
+            '/api/v1/titles/?cursor=',
+            '/api/v1/titles/?year=2000',
+            '/api/v1/titles/?genre=drama',
+            '/api/v1/titles/?category=films',
+            f'/api/v1/titles/{title.id}/',
+            reviews,
+            f'{reviews}?cursor=',
+            f'{reviews}{review.id}/',
+            comments,
+            f'{comments}?cursor=',
+            f'{comments}{comment.id}/',
+        )
+
+    def test_01_no_full_scans(self, client, catalog):
+        for url in self.urls(*catalog):
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == 200, url
+            for query in context.captured_queries:
+                sql = query['sql']
+                if not sql.startswith('SELECT'):
+                    continue
+                plan = explain(sql, ())
+                scans = [line for line in plan if FULL_SCAN.search(line)]
+                assert not scans, (
+                    f'Запрос к `{url}` полностью сканирует таблицу: '
+                    f'{scans}\n{sql}'
+                )
+                if 'reviews_review' in sql or 'reviews_comment' in sql:
+                    assert TEMP_SORT not in plan, (
+                        f'Запрос к `{url}` сортирует отзывы или комментарии '
+                        f'без индекса:\n{sql}'
+                    )
+
+    def test_02_last_modified_from_index(self, client, catalog):
+        validators = []
+        for url in self.urls(*catalog):
+            with CaptureQueriesContext(connection) as context:
+                client.get(url)
+            validators.extend(
+                query['sql'] for query in context.captured_queries
+                if 'MAX("reviews_review"."updated_at")' in query['sql']
+                or 'MAX("reviews_comment"."updated_at")' in query['sql']
+            )
+        assert validators
+        for sql in validators:
+            assert any(
+                'COVERING INDEX' in line for line in explain(sql, ())
+            ), (
+                'Проверьте, что дата последнего изменения отзывов и '
+                f'комментариев читается из индекса:\n{sql}'
+            )
@@ -0,0 +1,99 @@
+import datetime
+import decimal
+import uuid
+from collections import OrderedDict
+from io import BytesIO
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api import parsers, renderers
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+
+PAYLOADS = (
+    {'count': 0, 'next': None, 'previous': None, 'results': []},
+    OrderedDict(
+        id=1, name='Побег из Шоушенка', year=1994, rating=5.333333333333333,
+        genre=[OrderedDict(name='Драма', slug='drama')], category=None
+    ),
+    {'text': 'Строка\u2028с разделителями\u2029и "кавычками"\n'},
+    {
+        'pub_date': datetime.date(2020, 1, 13),
+        'updated_at': datetime.datetime(
+            2020, 1, 13, 23, 20, 2, 422123, tzinfo=datetime.timezone.utc
+        ),
+        'time': datetime.time(12, 30),
+    },
+    {
+        'score': decimal.Decimal('7.50'),
+        'id': uuid.UUID(int=1),
+        1: 'числовой ключ',
+        'message': gettext_lazy('Not found.'),
+    },
+    [{'nested': [[1, 2.5, True, False, None]]}, 2 ** 70],
+)
+
+
+@pytest.fixture(params=(True, False), ids=('fast', 'fallback'))
+def backend(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(renderers, 'orjson', None)
+        monkeypatch.setattr(parsers, 'orjson', None)
+    return request.param
+
+
+class Test22JsonBackend:
+
+    @pytest.mark.parametrize('payload', PAYLOADS)
+    def test_01_render_is_byte_compatible(self, payload, backend):
+        assert FastJSONRenderer().render(payload) == (
+            JSONRenderer().render(payload)
+        ), 'Проверьте, что рендерер выдаёт те же байты, что и JSONRenderer.'
+
+    def test_02_render_indent(self, backend):
+        payload = PAYLOADS[1]
+        for media_type in ('application/json; indent=4', None):
+            context = {} if media_type else {'indent': 2}
+            assert FastJSONRenderer().render(
+                payload, media_type, context
+            ) == JSONRenderer().render(payload, media_type, context)
+        assert FastJSONRenderer().render(None) == b''
+
+    @pytest.mark.parametrize('payload', PAYLOADS[:3] + PAYLOADS[5:])
+    def test_03_parse(self, payload, backend):
+        content = JSONRenderer().render(payload)
+        assert FastJSONParser().parse(BytesIO(content)) == (
+            JSONParser().parse(BytesIO(content))
+        )
+
+    @pytest.mark.parametrize(
+        'content', (b'{"a": ', b'{"a": NaN}', b''),
+        ids=('truncated', 'nan', 'empty')
+    )
+    def test_04_parse_errors(self, content, backend):
+        with pytest.raises(ParseError) as fast_error:
+            FastJSONParser().parse(BytesIO(content))
+        with pytest.raises(ParseError) as error:
+            JSONParser().parse(BytesIO(content))
+        assert str(fast_error.value) == str(error.value), (
+            'Проверьте, что парсер возвращает те же ошибки, что и JSONParser.'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_api_uses_fast_backend(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/',
+            data=b'{"name": "\xd0\xa4\xd0\xb8\xd0\xbb\xd1\x8c\xd0\xbc", '
+                 b'"slug": "films"}',
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+        assert isinstance(
+            response.accepted_renderer, FastJSONRenderer
+        ), 'Проверьте, что FastJSONRenderer указан в REST_FRAMEWORK.'
+        assert response.content == JSONRenderer().render(response.data)
+        assert response.json() == {'name': 'Фильм', 'slug': 'films'}
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api.serializers import (
+    CommentReadSerializer,
+    CommentSerializer,
+    ReviewReadSerializer,
+    ReviewSerializer,
+    TitleGetSerializer,
+    TitleReadSerializer
+)
+from reviews.models import Category, Comment, Genre, Review, Title
+
+
+def render(serializer_class, instances):
+    return JSONRenderer().render(
+        serializer_class(instances, many=True).data
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23ReadSerializers:
+
+    @pytest.fixture
+    def catalog(self, user, moderator):
+        category = Category.objects.create(name='Фильм', slug='films')
+        drama = Genre.objects.create(name='Драма', slug='drama')
+        comedy = Genre.objects.create(name='Комедия', slug='comedy')
+        title = Title.objects.create(
+            name='Фильм', year=2000, category=category, description='Текст'
+        )
+        title.genre.set([drama, comedy])
+        Title.objects.create(name='Без категории', year=1990)
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=5
+        )
+        Review.objects.create(
+            title=title, author=moderator, text='Ещё отзыв', score=8
+        )
+        Comment.objects.create(review=review, author=user, text='Первый')
+        Comment.objects.create(review=review, author=moderator, text='Второй')
+        return title, review
+
+    def test_01_same_output_as_model_serializers(self, catalog):
+        title, review = catalog
+        titles = Title.objects.for_listing().order_by('name')
+        reviews = title.reviews.select_related('author')
+        comments = review.comments.select_related('author')
+        for lean, full, instances in (
+            (TitleReadSerializer, TitleGetSerializer, titles),
+            (ReviewReadSerializer, ReviewSerializer, reviews),
+            (CommentReadSerializer, CommentSerializer, comments),
+        ):
+            assert render(lean, instances) == render(full, instances), (
+                f'Проверьте, что `{lean.__name__}` возвращает те же данные, '
+                f'что и `{full.__name__}`.'
+            )
+
+    def test_02_api_responses(self, client, catalog):
+        title, review = catalog
+        reviews_url = f'/api/v1/titles/{title.id}/reviews/'
+        comments_url = f'{reviews_url}{review.id}/comments/'
+        titles = Title.objects.for_listing().order_by('name')
+        expected = {
+            '/api/v1/titles/': TitleGetSerializer(titles, many=True),
+            f'/api/v1/titles/{title.id}/': TitleGetSerializer(
+                titles.get(pk=title.id)
+            ),
+            reviews_url: ReviewSerializer(
+                title.reviews.select_related('author'), many=True
+            ),
+            f'{reviews_url}{review.id}/': ReviewSerializer(review),
+            comments_url: CommentSerializer(
+                review.comments.select_related('author'), many=True
+            ),
+        }
+        for url, serializer in expected.items():
+            data = client.get(url).json()
+            data = data.get('results', data)
+            assert data == json.loads(
+                JSONRenderer().render(serializer.data)
+            ), f'Проверьте ответ `{url}`.'
+
+    def test_03_title_ordering(self, client, catalog):
+        response = client.get('/api/v1/titles/?ordering=-year')
+        assert response.status_code == 200, (
+            'Проверьте, что сортировка произведений работает с '
+            'облегчённым сериализатором.'
+        )
+        assert [title['year'] for title in response.json()['results']] == [
+            2000, 1990
+        ]
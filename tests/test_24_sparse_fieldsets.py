@@ -0,0 +1,130 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Comment, Genre, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24SparseFieldsets:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.fixture
+    def catalog(self, user, moderator):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title = Title.objects.create(
+            name='Фильм', year=2000, category=category, description='Текст'
+        )
+        title.genre.set([genre])
+        Title.objects.create(name='Второй', year=1990)
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=6
+        )
+        Review.objects.create(
+            title=title, author=moderator, text='Отзыв', score=9
+        )
+        Comment.objects.create(review=review, author=user, text='Коммент')
+        return title, review
+
+    def get(self, client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, url
+        return response.json(), ' '.join(
+            query['sql'] for query in context.captured_queries
+        )
+
+    def test_01_titles_fields(self, client, catalog):
+        data, sql = self.get(client, f'{self.TITLES_URL}?fields=id,name')
+        assert [set(title) for title in data['results']] == [
+            {'id', 'name'}, {'id', 'name'}
+        ]
+        assert 'reviews_genre' not in sql, (
+            'Проверьте, что жанры не загружаются, если поле `genre` '
+            'не запрошено.'
+        )
+        assert 'rating_sum' not in sql
+        assert '"reviews_title"."description"' not in sql
+        assert 'reviews_category' not in sql
+
+        data, sql = self.get(
+            client, f'{self.TITLES_URL}?fields=name,rating&ordering=-rating'
+        )
+        assert data['results'][0] == {'name': 'Фильм', 'rating': 7}
+
+    def test_02_titles_omit(self, client, catalog):
+        title, _ = catalog
+        data, sql = self.get(
+            client, f'{self.TITLES_URL}{title.id}/?omit=description,genre'
+        )
+        assert data == {
+            'id': title.id, 'name': 'Фильм', 'year': 2000, 'rating': 7,
+            'category': {'name': 'Фильм', 'slug': 'films'},
+        }
+        assert 'reviews_genre' not in sql
+
+    LIST_QUERIES = 4
+
+    def test_03_reviews_and_comments(self, client, catalog, admin,
+                                     django_assert_num_queries):
+        title, review = catalog
+        Review.objects.create(title=title, author=admin, text='Ещё', score=3)
+        Comment.objects.bulk_create(
+            Comment(review=review, author=admin, text=f'Коммент {number}')
+            for number in range(4)
+        )
+        reviews_url = f'{self.TITLES_URL}{title.id}/reviews/'
+        comments_url = f'{reviews_url}{review.id}/comments/'
+        for url in (
+            f'{reviews_url}?fields=id', f'{reviews_url}?fields=author',
+            f'{reviews_url}?omit=text', f'{comments_url}?fields=id',
+            f'{comments_url}?omit=text', f'{comments_url}?fields=author',
+        ):
+            client.get(url)
+            with django_assert_num_queries(self.LIST_QUERIES):
+                assert client.get(url).status_code == HTTPStatus.OK, url
+
+        _, sql = self.get(client, f'{reviews_url}?fields=author')
+        assert '"reviews_user"."email"' not in sql, (
+            'Проверьте, что для поля `author` из таблицы пользователей '
+            'загружается только `username`.'
+        )
+        data, sql = self.get(client, f'{reviews_url}?fields=id,score')
+        assert [set(item) for item in data['results']] == [
+            {'id', 'score'}, {'id', 'score'}, {'id', 'score'}
+        ]
+        assert 'reviews_user' not in sql
+
+        data, sql = self.get(
+            client, f'{reviews_url}?cursor=&fields=score'
+        )
+        assert [item['score'] for item in data['results']] == [6, 9, 3]
+
+        data, _ = self.get(
+            client, f'{reviews_url}{review.id}/comments/?omit=author,id'
+        )
+        assert data['results'][0] == {
+            'text': 'Коммент', 'pub_date': str(review.pub_date)
+        }
+
+    def test_04_categories_genres_users(self, client, admin_client,
+                                        catalog):
+        data, _ = self.get(client, '/api/v1/categories/?fields=slug')
+        assert data['results'] == [{'slug': 'films'}]
+        data, _ = self.get(client, '/api/v1/genres/?omit=slug')
+        assert data['results'] == [{'name': 'Драма'}]
+        data, _ = self.get(admin_client, '/api/v1/users/?fields=username')
+        assert all(set(user) == {'username'} for user in data['results'])
+
+    def test_05_unknown_fields(self, client, catalog):
+        for url in (
+            f'{self.TITLES_URL}?fields=id,secret',
+            f'{self.TITLES_URL}?omit=secret',
+            '/api/v1/categories/?fields=password',
+        ):
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.BAD_REQUEST, url
@@ -0,0 +1,94 @@
+import gzip
+from http import HTTPStatus
+
+import pytest
+
+from api.compression import BROTLI, GZIP, brotli, choose_encoder
+from reviews.models import Category, Title
+
+TITLES_URL = '/api/v1/titles/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Compression:
+
+    @pytest.fixture
+    def catalog(self):
+        category = Category.objects.create(name='Фильм', slug='films')
+        Title.objects.bulk_create(
+            Title(
+                name=f'Фильм {number}', year=2000, category=category,
+                description='Очень подробное описание произведения. ' * 5
+            )
+            for number in range(5)
+        )
+
+    def test_01_gzip(self, client, catalog):
+        plain = client.get(TITLES_URL)
+        response = client.get(TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert response['Content-Encoding'] == 'gzip', (
+            'Проверьте, что ответы сжимаются, если клиент принимает gzip.'
+        )
+        assert 'Accept-Encoding' in response['Vary']
+        assert int(response['Content-Length']) == len(response.content)
+        assert len(response.content) < len(plain.content)
+        assert gzip.decompress(response.content) == plain.content
+        assert 'Content-Encoding' not in plain
+
+    @pytest.mark.skipif(brotli is None, reason='brotli не установлен')
+    def test_02_brotli(self, client, catalog):
+        plain = client.get(TITLES_URL)
+        response = client.get(
+            TITLES_URL, HTTP_ACCEPT_ENCODING='gzip, deflate, br'
+        )
+        assert response['Content-Encoding'] == 'br'
+        assert brotli.decompress(response.content) == plain.content
+
+    def test_03_threshold(self, client, catalog, settings):
+        settings.COMPRESSION_MIN_SIZE = 10 ** 6
+        response = client.get(TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert 'Content-Encoding' not in response, (
+            'Проверьте, что ответы меньше `COMPRESSION_MIN_SIZE` '
+            'не сжимаются.'
+        )
+
+    def test_04_not_modified(self, client, catalog, settings):
+        for min_size in (settings.COMPRESSION_MIN_SIZE, 10 ** 6):
+            settings.COMPRESSION_MIN_SIZE = min_size
+            full = client.get(TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+            assert full['ETag'].startswith('W/"')
+            response = client.get(
+                TITLES_URL,
+                HTTP_ACCEPT_ENCODING='gzip',
+                HTTP_IF_NONE_MATCH=full['ETag']
+            )
+            assert response.status_code == HTTPStatus.NOT_MODIFIED
+            assert 'Content-Encoding' not in response
+            for header in ('ETag', 'Vary'):
+                assert response[header] == full[header], (
+                    f'Проверьте, что ответ 304 содержит тот же `{header}`, '
+                    'что и ответ 200 на тот же запрос.'
+                )
+
+    def test_05_streaming_export(self, admin_client, catalog):
+        url = '/api/v1/export/titles.ndjson'
+        plain = b''.join(admin_client.get(url).streaming_content)
+        response = admin_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        assert response.streaming
+        assert response['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(
+            b''.join(response.streaming_content)
+        ) == plain
+
+    @pytest.mark.parametrize('header, expected', (
+        ('', None),
+        ('identity', None),
+        ('gzip;q=0', None),
+        ('GZIP', GZIP),
+        ('deflate, gzip;q=0.5', GZIP),
+        ('*', BROTLI if brotli else GZIP),
+        ('br;q=0.1, gzip;q=0.9', GZIP),
+    ))
+    def test_06_negotiation(self, header, expected):
+        encoder = choose_encoder(header)
+        assert (encoder and encoder.name) == expected
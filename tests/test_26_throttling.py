@@ -0,0 +1,118 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.throttling import TokenBucketThrottle
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+TOKEN_URL = '/api/v1/auth/token/'
+CATEGORIES_URL = '/api/v1/categories/'
+
+
+class DictBucketStore:
+    buckets = {}
+
+    def get(self, key):
+        return self.buckets.get(key)
+
+    def set(self, key, bucket, timeout):
+        self.buckets[key] = bucket
+
+
+@pytest.fixture
+def rates(settings):
+    def set_rates(**scopes):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {
+                **settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'],
+                **scopes,
+            },
+        }
+    return set_rates
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        TokenBucketThrottle, 'timer', staticmethod(lambda: now[0])
+    )
+    return now
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26Throttling:
+
+    @pytest.mark.parametrize('url', (SIGNUP_URL, TOKEN_URL))
+    def test_01_auth_endpoints_limited(self, client, rates, clock, url):
+        rates(auth='3/min')
+        for _ in range(3):
+            response = client.post(url, data={})
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = client.post(url, data={})
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            f'Проверьте, что частые запросы к `{url}` ограничиваются.'
+        )
+        assert response['Retry-After'] == '20', (
+            'Проверьте, что ответ 429 содержит заголовок `Retry-After` '
+            'со временем до появления следующего токена.'
+        )
+
+        clock[0] += 20
+        response = client.post(url, data={})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что лимит восстанавливается со временем.'
+        )
+
+    def test_02_anonymous_reads(self, client, user_client, rates, clock):
+        rates(anon_read='2/min')
+        for _ in range(2):
+            assert client.get(CATEGORIES_URL).status_code == HTTPStatus.OK
+        response = client.get(CATEGORIES_URL)
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert 'Retry-After' in response
+        assert user_client.get(CATEGORIES_URL).status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит анонимного чтения не действует на '
+            'авторизованных пользователей.'
+        )
+
+    def test_03_authenticated_writes(self, admin_client, user_superuser_client,
+                                     client, rates, clock):
+        rates(user_write='2/min')
+        for number in range(2):
+            response = admin_client.post(
+                CATEGORIES_URL, data={'name': 'Фильм', 'slug': f's{number}'}
+            )
+            assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(
+            CATEGORIES_URL, data={'name': 'Фильм', 'slug': 'other'}
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что запись ограничивается для каждого пользователя.'
+        )
+        assert admin_client.get(CATEGORIES_URL).status_code == HTTPStatus.OK
+        response = user_superuser_client.post(
+            CATEGORIES_URL, data={'name': 'Фильм', 'slug': 'other'}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что лимит записи считается отдельно для '
+            'каждого пользователя.'
+        )
+
+    def test_04_disabled_rate(self, client, rates):
+        rates(auth=None)
+        for _ in range(20):
+            response = client.post(SIGNUP_URL, data={})
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_05_pluggable_store(self, client, rates, settings):
+        rates(auth='1/min')
+        settings.THROTTLE_STORE = 'tests.test_26_throttling.DictBucketStore'
+        DictBucketStore.buckets.clear()
+        client.post(SIGNUP_URL, data={})
+        assert list(DictBucketStore.buckets) == ['throttle:auth:127.0.0.1'], (
+            'Проверьте, что хранилище корзин задаётся `THROTTLE_STORE`.'
+        )
+        response = client.post(SIGNUP_URL, data={})
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Comment, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27ObjectPermissions:
+
+    REVIEW_UPDATE_QUERIES = 4
+    COMMENT_UPDATE_QUERIES = 2
+    REVIEW_DELETE_QUERIES = 7
+    COMMENT_DELETE_QUERIES = 4
+
+    @pytest.fixture
+    def review(self, user):
+        category = Category.objects.create(name='Фильм', slug='films')
+        title = Title.objects.create(
+            name='Произведение', year=2000, category=category
+        )
+        return Review.objects.create(
+            title=title, author=user, text='Отзыв', score=5
+        )
+
+    @pytest.fixture
+    def comment(self, review, user):
+        return Comment.objects.create(
+            review=review, author=user, text='Комментарий'
+        )
+
+    def review_url(self, review):
+        return f'/api/v1/titles/{review.title_id}/reviews/{review.id}/'
+
+    def comment_url(self, comment):
+        return (
+            f'/api/v1/titles/{comment.review.title_id}/reviews/'
+            f'{comment.review_id}/comments/{comment.id}/'
+        )
+
+    def count_queries(self, client, method, url, data=None):
+        client.get('/api/v1/categories/')
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(url, data=data)
+        return len(context.captured_queries), response
+
+    def test_01_moderator_updates_review(self, moderator_client, review):
+        queries, response = self.count_queries(
+            moderator_client, 'patch', self.review_url(review),
+            {'text': 'Исправлено модератором'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['author'] == review.author.username
+        assert queries == self.REVIEW_UPDATE_QUERIES, (
+            'Проверьте, что изменение отзыва модератором выполняет '
+            f'{self.REVIEW_UPDATE_QUERIES} запроса к БД, '
+            f'сейчас выполняется {queries}.'
+        )
+
+    def test_02_moderator_updates_comment(self, moderator_client, comment):
+        queries, response = self.count_queries(
+            moderator_client, 'patch', self.comment_url(comment),
+            {'text': 'Исправлено модератором'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['author'] == comment.author.username
+        assert queries == self.COMMENT_UPDATE_QUERIES, (
+            'Проверьте, что изменение комментария модератором выполняет '
+            f'{self.COMMENT_UPDATE_QUERIES} запроса к БД, '
+            f'сейчас выполняется {queries}.'
+        )
+
+    def test_03_moderator_deletes(self, moderator_client, comment):
+        queries, response = self.count_queries(
+            moderator_client, 'delete', self.comment_url(comment)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert queries == self.COMMENT_DELETE_QUERIES
+        queries, response = self.count_queries(
+            moderator_client, 'delete', self.review_url(comment.review)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert queries == self.REVIEW_DELETE_QUERIES
+
+    def test_04_author_and_strangers(self, user_client, admin, review):
+        response = user_client.patch(
+            self.review_url(review), data={'text': 'Своё'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        review.author = admin
+        review.save()
+        response = user_client.patch(
+            self.review_url(review), data={'text': 'Чужое'}
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что пользователь не может изменять чужие отзывы.'
+        )
+
+    def test_05_scoped_lookup(self, moderator_client, comment):
+        title = Title.objects.create(name='Другое', year=2001)
+        response = moderator_client.patch(
+            f'/api/v1/titles/{title.id}/reviews/{comment.review_id}/',
+            data={'text': 'Не тот отзыв'}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = moderator_client.delete(
+            f'/api/v1/titles/{title.id}/reviews/{comment.review_id}/'
+            f'comments/{comment.id}/'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что комментарий ищется только в пределах отзыва '
+            'и произведения из URL.'
+        )
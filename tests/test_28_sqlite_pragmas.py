@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28SQLitePragmas:
+
+    @pytest.fixture
+    def connect(self, tmp_path):
+        wrappers = []
+
+        def connect_to_file():
+            wrapper = DatabaseWrapper(
+                {**connection.settings_dict,
+                 'NAME': str(tmp_path / 'db.sqlite3')},
+                alias='pragmas'
+            )
+            wrapper.ensure_connection()
+            wrappers.append(wrapper)
+            return wrapper
+        yield connect_to_file
+        for wrapper in wrappers:
+            wrapper.close()
+
+    def read_pragmas(self, wrapper, names):
+        with wrapper.cursor() as cursor:
+            return {
+                name: cursor.execute(f'PRAGMA {name}').fetchone()[0]
+                for name in names
+            }
+
+    def test_01_default_profile(self, connect):
+        pragmas = self.read_pragmas(connect(), (
+            'journal_mode', 'synchronous', 'busy_timeout',
+            'mmap_size', 'cache_size', 'temp_store'
+        ))
+        assert pragmas == {
+            'journal_mode': 'wal',
+            'synchronous': 1,
+            'busy_timeout': 5000,
+            'mmap_size': 128 * 1024 * 1024,
+            'cache_size': -20000,
+            'temp_store': 2,
+        }, (
+            'Проверьте, что при подключении к SQLite применяются '
+            'настройки из `SQLITE_PRAGMAS`.'
+        )
+
+    def test_02_configurable(self, connect, settings):
+        settings.SQLITE_PRAGMAS = {'busy_timeout': 1000}
+        pragmas = self.read_pragmas(
+            connect(), ('journal_mode', 'busy_timeout', 'temp_store')
+        )
+        assert pragmas == {
+            'journal_mode': 'delete',
+            'busy_timeout': 1000,
+            'temp_store': 0,
+        }
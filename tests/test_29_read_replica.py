@@ -0,0 +1,108 @@
+import sqlite3
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import caches
+from django.db import connection, connections
+
+from reviews.models import Category, Review, Title
+
+REPLICA = 'replica'
+TITLES_URL = '/api/v1/titles/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29ReadReplica:
+
+    @pytest.fixture
+    def title(self):
+        category = Category.objects.create(name='Фильм', slug='films')
+        return Title.objects.create(
+            name='Старое', year=2000, category=category
+        )
+
+    @pytest.fixture
+    def replica(self, title, settings, tmp_path):
+        path = str(tmp_path / 'replica.sqlite3')
+        connection.ensure_connection()
+        target = sqlite3.connect(path)
+        connection.connection.backup(target)
+        target.close()
+        connections.databases[REPLICA] = {
+            **connection.settings_dict, 'NAME': path
+        }
+        settings.DATABASE_REPLICAS = (REPLICA,)
+        yield REPLICA
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.databases[REPLICA]
+
+    def names(self, response):
+        assert response.status_code == HTTPStatus.OK
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_reads_from_replica(self, client, title, replica):
+        Title.objects.create(name='Новое', year=2001)
+        assert self.names(client.get(TITLES_URL)) == ['Старое'], (
+            'Проверьте, что GET-запросы к произведениям читают из реплики.'
+        )
+        response = client.get(f'{TITLES_URL}{title.id}/reviews/')
+        assert response.status_code == HTTPStatus.OK
+
+    def test_02_writes_go_to_primary(self, admin_client, replica):
+        response = admin_client.post(TITLES_URL, data={
+            'name': 'Новое', 'year': 2001, 'category': 'films'
+        })
+        assert response.status_code == HTTPStatus.CREATED
+        assert Title.objects.filter(name='Новое').exists()
+        assert not Title.objects.using(replica).filter(
+            name='Новое'
+        ).exists(), 'Проверьте, что запись идёт в основную базу.'
+
+    def test_03_sticky_primary_after_write(self, admin_client, client,
+                                           title, replica):
+        response = admin_client.post(
+            f'{TITLES_URL}{title.id}/reviews/',
+            data={'text': 'Отзыв', 'score': 7}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.get(f'{TITLES_URL}{title.id}/reviews/')
+        assert response.json()['count'] == 1, (
+            'Проверьте, что после записи пользователь какое-то время '
+            'читает из основной базы и видит свои изменения.'
+        )
+        response = client.get(f'{TITLES_URL}{title.id}/reviews/')
+        assert response.json()['count'] == 0
+
+        caches['default'].clear()
+        response = admin_client.get(f'{TITLES_URL}{title.id}/reviews/')
+        assert response.json()['count'] == 0, (
+            'Проверьте, что по истечении окна чтение возвращается на реплику.'
+        )
+        assert Review.objects.count() == 1
+
+    def test_04_other_endpoints_use_primary(self, admin_client, replica,
+                                            django_user_model):
+        django_user_model.objects.create(
+            username='fresh', email='fresh@yamdb.fake'
+        )
+        response = admin_client.get('/api/v1/users/fresh/')
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что на реплику уходят только чтения каталога.'
+        )
+
+    def test_05_list_cache_filled_from_primary(self, admin_client, client,
+                                               replica):
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Книга', 'slug': 'books'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        for _ in range(2):
+            response = client.get('/api/v1/categories/')
+            assert response.status_code == HTTPStatus.OK
+            assert 'books' in [
+                category['slug'] for category in response.json()['results']
+            ], (
+                'Проверьте, что при промахе кэш списка заполняется из '
+                'основной базы, а не из отстающей реплики.'
+            )
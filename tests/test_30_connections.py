@@ -0,0 +1,116 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+from django.db import connection, connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import AsyncClient
+
+from api import connections as pooling
+from api.metrics import registry
+from reviews.models import Category
+
+OPENED = 'yamdb_db_connections_opened_total'
+FAILED = 'yamdb_db_connection_health_check_failures_total'
+
+
+def counter(metric, alias):
+    counters, _ = registry.snapshot()
+    return counters.get((metric, (('database', alias),)), 0)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30Connections:
+
+    @pytest.fixture
+    def file_connection(self, tmp_path):
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, 'NAME': str(tmp_path / 'db.sqlite3')},
+            alias='health'
+        )
+        yield wrapper
+        wrapper.close()
+
+    @pytest.fixture
+    def pool(self):
+        yield pooling.install_pool(2)
+        pooling.install_pool(0)
+
+    def test_01_opened_connections_counted(self, file_connection):
+        before = counter(OPENED, 'health')
+        file_connection.ensure_connection()
+        file_connection.ensure_connection()
+        assert counter(OPENED, 'health') == before + 1, (
+            'Проверьте, что открытие соединения с БД учитывается в '
+            f'метрике `{OPENED}`.'
+        )
+
+    def test_02_unhealthy_connection_closed(self, file_connection,
+                                            monkeypatch):
+        file_connection.ensure_connection()
+        assert pooling.is_healthy(file_connection)
+        monkeypatch.setattr(file_connection, 'is_usable', lambda: False)
+        before = counter(FAILED, 'health')
+        assert not pooling.is_healthy(file_connection)
+        assert file_connection.connection is None, (
+            'Проверьте, что соединение, не прошедшее проверку, закрывается.'
+        )
+        assert counter(FAILED, 'health') == before + 1
+
+    def test_03_checked_on_request(self, client, monkeypatch):
+        checks = []
+        connection.ensure_connection()
+        monkeypatch.setitem(connection.settings_dict, 'CONN_HEALTH_CHECKS',
+                            True)
+        monkeypatch.setattr(
+            connection, 'is_usable', lambda: checks.append(1) or True
+        )
+        assert client.get('/api/v1/titles/').status_code == HTTPStatus.OK
+        assert checks, (
+            'Проверьте, что перед запросом постоянные соединения '
+            'проверяются на работоспособность.'
+        )
+        monkeypatch.setitem(connection.settings_dict, 'CONN_HEALTH_CHECKS',
+                            False)
+        checks.clear()
+        client.get('/api/v1/titles/')
+        assert not checks
+
+    def test_04_pool_reuses_connections(self, pool):
+        Category.objects.create(name='Фильм', slug='films')
+        default = connections['default']
+        before = counter(OPENED, 'default')
+
+        def count_categories():
+            return id(connections['default']), Category.objects.count()
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(
+                lambda _: pool.call(count_categories), range(12)
+            ))
+        assert {count for _, count in results} == {1}
+        assert len({wrapper for wrapper, _ in results}) <= 2, (
+            'Проверьте, что пул не открывает больше соединений, '
+            'чем его размер.'
+        )
+        assert counter(OPENED, 'default') - before <= 2
+        assert connections['default'] is default
+
+    def test_05_run_sync(self, pool):
+        Category.objects.create(name='Фильм', slug='films')
+        assert asyncio.run(
+            pooling.run_sync(Category.objects.count)
+        ) == 1
+
+    def test_06_pooled_queries_in_metrics(self, pool, async_views):
+        Category.objects.create(name='Фильм', slug='films')
+        metric = 'yamdb_db_queries_total'
+        labels = (('route', 'titles-list'), ('method', 'GET'))
+        before = registry.snapshot()[0].get((metric, labels), 0)
+        response = asyncio.run(AsyncClient().get('/api/v1/titles/'))
+        assert response.status_code == HTTPStatus.OK
+        assert registry.snapshot()[0].get((metric, labels), 0) > before, (
+            'Проверьте, что запросы к БД на соединениях из пула '
+            f'учитываются в метрике `{metric}`.'
+        )
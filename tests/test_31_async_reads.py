@@ -0,0 +1,119 @@
+import asyncio
+import importlib
+from http import HTTPStatus
+
+import pytest
+from django.test import AsyncClient
+from django.urls import resolve
+
+from api.connections import install_pool
+from api_yamdb import settings as project_settings
+from reviews.models import Category, Comment, Genre, Review, Title
+
+READ_ROUTES = (
+    'titles-list', 'titles-detail', 'review-list', 'review-detail',
+    'comment-list', 'comment-detail',
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test31AsyncReads:
+
+    @pytest.fixture
+    def urls(self, user):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title = Title.objects.create(
+            name='Произведение', year=2000, category=category,
+            description='Описание'
+        )
+        title.genre.set([genre])
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=8
+        )
+        comment = Comment.objects.create(
+            review=review, author=user, text='Комментарий'
+        )
+        reviews = f'/api/v1/titles/{title.id}/reviews/'
+        comments = f'{reviews}{review.id}/comments/'
+        return (
+            '/api/v1/titles/', f'/api/v1/titles/{title.id}/',
+            reviews, f'{reviews}{review.id}/',
+            comments, f'{comments}{comment.id}/',
+            '/api/v1/titles/?fields=name', f'{reviews}?limit=1',
+            f'/api/v1/titles/{title.id + 1}/',
+        )
+
+    @pytest.fixture(params=(0, 2), ids=('bridge', 'pool'))
+    def pool(self, request, async_views):
+        yield install_pool(request.param)
+        install_pool(0)
+
+    def fetch(self, urls, **headers):
+        async def fetch_all():
+            client = AsyncClient()
+            return await asyncio.gather(
+                *(client.get(url, **headers) for url in urls)
+            )
+        return asyncio.run(fetch_all())
+
+    def test_01_read_views_are_async(self, urls, async_views):
+        for url in urls[:6]:
+            match = resolve(url)
+            assert match.url_name in READ_ROUTES
+            assert asyncio.iscoroutinefunction(match.func), (
+                f'Проверьте, что под ASGI маршрут `{match.url_name}` '
+                'обслуживается асинхронным представлением.'
+            )
+
+    def test_02_wsgi_views_are_sync(self, urls):
+        for url in urls[:6]:
+            assert not asyncio.iscoroutinefunction(resolve(url).func), (
+                'Проверьте, что без ASGI представления остаются '
+                'синхронными и не проходят через `async_to_sync`.'
+            )
+
+    def test_03_identical_responses(self, client, urls, pool):
+        for url, response in zip(urls, self.fetch(urls)):
+            expected = client.get(url)
+            assert response.status_code == expected.status_code
+            assert response.content == expected.content, (
+                f'Проверьте, что асинхронный ответ `{url}` совпадает '
+                'с синхронным.'
+            )
+            assert response.get('ETag') == expected.get('ETag')
+
+    def test_04_same_permissions(self, urls, token_user, pool):
+        auth = {'authorization': f'Bearer {token_user["access"]}'}
+
+        async def write():
+            client = AsyncClient()
+            return (
+                await client.post(urls[0], {'name': 'Новое'}),
+                await client.post(urls[0], {'name': 'Новое'}, **auth),
+                await client.delete(urls[1], **auth),
+            )
+        anonymous, user, delete = asyncio.run(write())
+        assert anonymous.status_code == HTTPStatus.UNAUTHORIZED
+        assert user.status_code == HTTPStatus.FORBIDDEN
+        assert delete.status_code == HTTPStatus.FORBIDDEN
+        for response in self.fetch(urls[:6], **auth):
+            assert response.status_code == HTTPStatus.OK
+
+    def test_05_asgi_switch_from_environment(self, settings, monkeypatch):
+        for value, expected in ((None, True), ('0', False)):
+            if value is None:
+                monkeypatch.delenv('YAMDB_ASYNC_READ_VIEWS', raising=False)
+            else:
+                monkeypatch.setenv('YAMDB_ASYNC_READ_VIEWS', value)
+            importlib.reload(importlib.import_module('api_yamdb.asgi'))
+            assert settings.ASYNC_READ_VIEWS is False, (
+                'Проверьте, что `asgi.py` не перезаписывает настройки.'
+            )
+            assert importlib.reload(
+                project_settings
+            ).ASYNC_READ_VIEWS is expected, (
+                'Проверьте, что `ASYNC_READ_VIEWS` читается из переменной '
+                '`YAMDB_ASYNC_READ_VIEWS`, а `asgi.py` только задаёт её '
+                'значение по умолчанию.'
+            )